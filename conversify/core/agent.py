@@ -3,6 +3,7 @@ import re
 from collections.abc import AsyncIterable
 from typing import Any
 
+import httpx
 from livekit import rtc
 from livekit.agents import Agent, FunctionTool, llm
 from livekit.agents.llm.chat_context import ImageContent
@@ -26,6 +27,7 @@ class ConversifyAgent(Agent):
         participant_identity: str,
         shared_state: dict[str, Any],
         config: dict[str, Any],
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         agent_config = config["agent"]
         memory_config = config["memory"]
@@ -63,7 +65,9 @@ class ConversifyAgent(Agent):
         self.memory_handler = None
         if memory_config["use"]:
             self.memory_handler = AgentMemoryManager(
-                participant_identity=self.participant_identity, config=config
+                participant_identity=self.participant_identity,
+                config=config,
+                http_client=http_client,
             )
 
         logger.info(
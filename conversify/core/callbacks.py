@@ -2,6 +2,7 @@ import asyncio
 import logging
 from typing import Any
 
+import httpx
 from livekit.agents import AgentSession, metrics
 from livekit.agents.metrics import EOUMetrics, LLMMetrics, TTSMetrics
 from livekit.agents.voice import MetricsCollectedEvent
@@ -46,7 +47,11 @@ def metrics_callback(session: AgentSession):
             tts_ttfb = 0
 
 
-async def shutdown_callback(agent: ConversifyAgent, video_task: asyncio.Task | None):
+async def shutdown_callback(
+    agent: ConversifyAgent | None,
+    video_task: asyncio.Task | None,
+    http_client: httpx.AsyncClient | None = None,
+):
     """Handles graceful shutdown logic: cancels tasks, logs usage, saves memory."""
     logger.info("Application shutdown initiated")
 
@@ -66,8 +71,8 @@ async def shutdown_callback(agent: ConversifyAgent, video_task: asyncio.Task | N
     summary: dict[str, Any] = usage_collector.get_summary()
     logger.info(f"Usage Summary: {summary}")
 
-    # Save conversation history if available
-    if agent.memory_handler:
+    # Save conversation history if available (no agent if the job ended early)
+    if agent is not None and agent.memory_handler:
         try:
             logger.info("Saving conversation memory...")
             if not hasattr(agent, "chat_ctx") or agent.chat_ctx is None:
@@ -82,4 +87,8 @@ async def shutdown_callback(agent: ConversifyAgent, video_task: asyncio.Task | N
     else:
         logger.info("Memory handler not available, skipping memory save.")
 
+    # Close the shared HTTP client only after the memory save has used it
+    if http_client is not None:
+        await http_client.aclose()
+
     logger.info("Shutdown callback finished.")
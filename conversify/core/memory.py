@@ -1,19 +1,84 @@
+import asyncio
+import base64
+import contextlib
+import hashlib
+import itertools
+import json
 import logging
 import os
-from collections.abc import Callable
-from typing import Any
-
+import re
+import tempfile
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import IO, Any
+
+import httpx
 import numpy as np
+import orjson
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.prompts import PromptTemplate
 from langchain_openai import ChatOpenAI
 from livekit.agents import ChatContext, ChatMessage
-from memoripy import ChatModel, EmbeddingModel, JSONStorage, MemoryManager
-from openai import OpenAI
+from memoripy import (
+    BaseStorage,
+    ChatModel,
+    EmbeddingModel,
+    JSONStorage,
+    MemoryManager,
+)
+from openai import AsyncOpenAI, OpenAI
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Bump when the concept-extraction prompt changes so cached results are not reused
+CONCEPT_PROMPT_VERSION = "v1"
+
+# Acknowledgement words that carry no retrievable signal on their own; an
+# interaction made up only of these is not worth an LLM/embedding call
+_FILLER_WORDS = frozenset(
+    {
+        "ok",
+        "okay",
+        "yes",
+        "yeah",
+        "yep",
+        "no",
+        "nope",
+        "sure",
+        "thanks",
+        "thank",
+        "you",
+        "hi",
+        "hello",
+        "hey",
+        "bye",
+        "goodbye",
+        "hmm",
+        "uh",
+        "huh",
+        "got",
+        "it",
+        "alright",
+        "cool",
+        "great",
+    }
+)
+
+
+def _atomic_write(path: str, data: bytes) -> None:
+    """Write a file via a temporary sibling and os.replace so readers never see partial data."""
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or None, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(tmp_path)
+        raise
+
 
 class ConceptExtractionResponse(BaseModel):
     """Model for structured response from concept extraction."""
@@ -23,20 +88,44 @@ class ConceptExtractionResponse(BaseModel):
     )
 
 
+# The parser is stateless and its format instructions are constant, so build
+# them once instead of re-serializing the schema per ChatCompletionsModel
+_PARSER = JsonOutputParser(pydantic_object=ConceptExtractionResponse)
+_FORMAT_INSTRUCTIONS = _PARSER.get_format_instructions()
+
+
 class ChatCompletionsModel(ChatModel):
     """Implementation of ChatModel for concept extraction using LLM."""
 
-    def __init__(self, llm_config: dict[str, Any]):
+    def __init__(
+        self,
+        llm_config: dict[str, Any],
+        cache_dir: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 4,
+    ):
         """
         Initialize the ChatCompletionsModel with configuration.
 
         Args:
             llm_config: dictionary containing LLM configuration (base_url, api_key, model)
+            cache_dir: Directory for cached concept extractions (None disables caching)
+            http_client: Shared HTTP client for async requests (None creates one)
+            max_concurrency: Maximum number of concurrent async LLM requests
         """
         api_endpoint = llm_config["base_url"]
         api_key = llm_config["api_key"]
         model_name = llm_config["model"]
 
+        self.model_name = model_name
+        self._cache_dir = cache_dir
+        # Bounds concurrent extractions so a large batch can't take over the
+        # HTTP pool shared with the live agent
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+            logger.info(f"Concept extraction cache directory: {cache_dir}")
+
         logger.info(
             f"Initializing ChatCompletionsModel with endpoint: {api_endpoint}, model: {model_name}"
         )
@@ -47,8 +136,9 @@ class ChatCompletionsModel(ChatModel):
                 model_name=model_name,
                 request_timeout=30.0,
                 max_retries=2,
+                http_async_client=http_client,
             )
-            self.parser = JsonOutputParser(pydantic_object=ConceptExtractionResponse)
+            self.parser = _PARSER
             self.prompt_template = PromptTemplate(
                 template=(
                     "Extract key concepts from the following text in a concise, context-specific manner. "
@@ -57,10 +147,9 @@ class ChatCompletionsModel(ChatModel):
                     "{format_instructions}\n{text}"
                 ),
                 input_variables=["text"],
-                partial_variables={
-                    "format_instructions": self.parser.get_format_instructions()
-                },
+                partial_variables={"format_instructions": _FORMAT_INSTRUCTIONS},
             )
+            self.chain = self.prompt_template | self.llm | self.parser
             logger.info("ChatCompletionsModel initialized successfully.")
         except Exception as e:
             logger.error(
@@ -114,23 +203,128 @@ class ChatCompletionsModel(ChatModel):
             )
             return []
 
+        cached = self._read_cache(text)
+        if cached is not None:
+            logger.debug(f"Concepts loaded from cache: {cached}")
+            return cached
+
         try:
-            chain = self.prompt_template | self.llm | self.parser
-            response = chain.invoke({"text": text})
-            concepts = response.get("concepts", [])
+            response = self.chain.invoke({"text": text})
+            valid_concepts = self._validate_concepts(response)
+            if valid_concepts is None:
+                logger.warning(f"Unexpected concept extraction response: {response!r}")
+                return []
+            self._write_cache(text, valid_concepts)
+            logger.debug(f"Concepts extracted: {valid_concepts}")
+            return valid_concepts
+        except Exception as e:
+            logger.error(f"Error during concept extraction: {e}", exc_info=True)
+            return []
 
-            # Validate concepts
-            valid_concepts = []
-            for concept in concepts:
-                if isinstance(concept, str) and concept.strip():
-                    valid_concepts.append(concept.strip())
+    async def aextract_concepts(self, text: str) -> list[str]:
+        """
+        Asynchronously extract key concepts from the input text.
 
-            logger.debug(f"Concepts extracted: {valid_concepts}")
+        Args:
+            text: The text to extract concepts from
+
+        Returns:
+            list of extracted concept strings
+        """
+        if not text or not isinstance(text, str) or not text.strip():
+            return []
+
+        # The disk cache does blocking file I/O; keep it off the event loop
+        if self._cache_dir:
+            cached = await asyncio.to_thread(self._read_cache, text)
+            if cached is not None:
+                return cached
+
+        try:
+            async with self._semaphore:
+                response = await self.chain.ainvoke({"text": text})
+            valid_concepts = self._validate_concepts(response)
+            if valid_concepts is None:
+                logger.warning(f"Unexpected concept extraction response: {response!r}")
+                return []
+            if self._cache_dir:
+                await asyncio.to_thread(self._write_cache, text, valid_concepts)
             return valid_concepts
         except Exception as e:
             logger.error(f"Error during concept extraction: {e}", exc_info=True)
             return []
 
+    async def aextract_concepts_batch(self, texts: list[str]) -> list[list[str]]:
+        """
+        Extract key concepts from several texts, running up to max_concurrency
+        LLM calls at a time.
+
+        Args:
+            texts: The texts to extract concepts from
+
+        Returns:
+            list of extracted concept lists, one per input text (empty on failure)
+        """
+        results = await asyncio.gather(*(self.aextract_concepts(t) for t in texts))
+        logger.debug(f"Concepts extracted for {len(texts)} texts concurrently")
+        return list(results)
+
+    def _cache_path(self, text: str) -> str | None:
+        """Return the cache file for a text, keyed by model, prompt version and content."""
+        if not self._cache_dir:
+            return None
+        key = hashlib.sha256(
+            f"{self.model_name}|{CONCEPT_PROMPT_VERSION}|{text}".encode()
+        ).hexdigest()
+        return os.path.join(self._cache_dir, f"{key}.json")
+
+    def _read_cache(self, text: str) -> list[str] | None:
+        """Return cached concepts for a text, or None on a miss."""
+        path = self._cache_path(text)
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                cached = ConceptExtractionResponse.model_validate(json.load(f))
+            return cached.concepts
+        except ValueError as e:
+            # Corrupt or outdated entry: evict it so the next call repopulates it
+            logger.warning(f"Evicting invalid concept cache entry {path}: {e}")
+            with contextlib.suppress(OSError):
+                os.remove(path)
+        except OSError as e:
+            logger.warning(f"Failed to read concept cache entry {path}: {e}")
+        return None
+
+    def _write_cache(self, text: str, concepts: list[str]) -> None:
+        """Atomically store extracted concepts for a text."""
+        path = self._cache_path(text)
+        if not path:
+            return
+
+        try:
+            _atomic_write(path, orjson.dumps({"concepts": concepts, "ts": time.time()}))
+        except OSError as e:
+            logger.warning(f"Failed to write concept cache entry {path}: {e}")
+
+    @staticmethod
+    def _validate_concepts(response: Any) -> list[str] | None:
+        """
+        Keep only the non-empty string concepts from a parsed LLM response.
+        Returns None for a malformed response so it is not cached as "no concepts".
+        """
+        if not isinstance(response, dict):
+            return None
+        concepts = response.get("concepts", [])
+        if not isinstance(concepts, list):
+            return None
+        return [
+            concept.strip()
+            for concept in concepts
+            if isinstance(concept, str) and concept.strip()
+        ]
+
 
 class OllamaEmbeddingModel(EmbeddingModel):
     """
@@ -138,30 +332,59 @@ class OllamaEmbeddingModel(EmbeddingModel):
     Expects config keys: base_url, api_key, model
     """
 
-    def __init__(self, embedding_config: dict[str, Any]):
+    def __init__(
+        self,
+        embedding_config: dict[str, Any],
+        cache_dir: str | None = None,
+        http_client: httpx.AsyncClient | None = None,
+    ):
         self.base_url: str = embedding_config["base_url"]
         self.api_key: str = embedding_config.get("api_key", "ollama") or "ollama"
         self.model: str = embedding_config["model"]
 
-        # OpenAI client pointed at Ollama (or any OpenAI-compatible server)
+        # OpenAI clients pointed at Ollama (or any OpenAI-compatible server);
+        # the sync one backs the Memoripy EmbeddingModel interface
         self.client = OpenAI(base_url=self.base_url, api_key=self.api_key)
+        self.async_client = AsyncOpenAI(
+            base_url=self.base_url, api_key=self.api_key, http_client=http_client
+        )
 
-        # Optional: cache the dimension after first probe
+        # Optional: cache the dimension after first probe (persisted in cache_dir)
         self._dimension: int | None = None
+        self._cache_dir = cache_dir
+
+        # LRU cache of embeddings keyed by normalized text (0 disables it)
+        self._cache_size: int = int(embedding_config.get("cache_size", 1024))
+        self._cache: OrderedDict[str, np.ndarray] = OrderedDict()
+        # Maximum number of texts sent per embeddings request
+        self.batch_size: int = max(1, int(embedding_config.get("batch_size", 64)))
         logger.info(f"OllamaEmbeddingModel initialized: {self.model} @ {self.base_url}")
 
     def initialize_embedding_dimension(self) -> int:
         """
         Probe the embeddings API once to learn the vector dimension.
+        The result is persisted so later processes can skip the probe.
         """
+        if self._dimension is not None:
+            return self._dimension
+
+        dimension_file = self._dimension_file()
+        if dimension_file and os.path.exists(dimension_file):
+            try:
+                with open(dimension_file, encoding="utf-8") as f:
+                    self._dimension = int(f.read().strip())
+                logger.info(f"Embedding dimension loaded from cache: {self._dimension}")
+                return self._dimension
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring invalid embedding dimension cache: {e}")
+
         try:
             resp = self.client.embeddings.create(
-                model=self.model, input="dimension_check"
+                model=self.model, input="dimension_check", encoding_format="base64"
             )
-            vec = resp.data[0].embedding
+            vec = self._decode_embedding(resp.data[0].embedding)
             self._dimension = len(vec)
             logger.info(f"Embedding dimension determined: {self._dimension}")
-            return self._dimension
         except Exception as e:
             logger.error(f"Failed to determine embedding dimension: {e}", exc_info=True)
             # Fallback
@@ -169,58 +392,338 @@ class OllamaEmbeddingModel(EmbeddingModel):
             logger.warning("Falling back to default embedding dimension 768.")
             return self._dimension
 
+        if dimension_file:
+            try:
+                _atomic_write(dimension_file, str(self._dimension).encode())
+            except OSError as e:
+                logger.warning(f"Failed to persist embedding dimension: {e}")
+        return self._dimension
+
+    def _dimension_file(self) -> str | None:
+        """Return the file caching the dimension of this embedding model and endpoint."""
+        if not self._cache_dir:
+            return None
+        # The same model name can serve a different dimension on another server
+        slug = re.sub(r"[^A-Za-z0-9._-]+", "_", self.model)
+        endpoint = hashlib.sha256(self.base_url.rstrip("/").encode()).hexdigest()[:12]
+        return os.path.join(self._cache_dir, f".embed_dim_{slug}_{endpoint}")
+
     @property
     def dimension(self) -> int | None:
         return self._dimension
 
+    @staticmethod
+    def _decode_embedding(raw: str | list[float]) -> np.ndarray:
+        """Decode a base64 float32 payload (or a plain float list) into a vector."""
+        if isinstance(raw, str):
+            return np.frombuffer(base64.b64decode(raw), dtype=np.float32)
+        return np.fromiter(raw, dtype=np.float32, count=len(raw))
+
+    @staticmethod
+    def _cache_key(text: str) -> str:
+        """Normalize case and whitespace so trivially different texts share an entry."""
+        return " ".join(text.lower().split())
+
+    def _cache_get(self, text: str) -> np.ndarray | None:
+        """Return a cached embedding for a text, refreshing its LRU position."""
+        key = self._cache_key(text)
+        vec = self._cache.get(key)
+        if vec is not None:
+            self._cache.move_to_end(key)
+        return vec
+
+    def _cache_put(self, text: str, vec: np.ndarray) -> None:
+        """Store an embedding, evicting the least recently used entry when full."""
+        if self._cache_size <= 0:
+            return
+        key = self._cache_key(text)
+        vec.setflags(write=False)  # shared between callers
+        self._cache[key] = vec
+        self._cache.move_to_end(key)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
     def get_embedding(self, text: str) -> np.ndarray:
         """
         Get embedding vector for a string. Returns zeros on error/empty input.
         """
-        try:
+        if not text or not isinstance(text, str) or not text.strip():
+            logger.warning("Empty text for embedding; returning zero vector")
+        return self.get_embeddings_batch([text])[0]
+
+    def get_embeddings_batch(
+        self, texts: list[str], raise_on_error: bool = False
+    ) -> np.ndarray:
+        """
+        Get embedding vectors for several strings, one API request per batch_size texts.
+        Rows for empty input, or for the texts of a failed request, are zeros.
+
+        Args:
+            texts: The texts to embed
+            raise_on_error: Raise on a failed request instead of leaving zero rows
+        """
+        vectors, pending = self._lookup_batch(texts)
+        for part in self._request_slices(pending):
+            try:
+                resp = self.client.embeddings.create(
+                    model=self.model,
+                    input=[texts[i] for i in part],
+                    encoding_format="base64",
+                )
+                self._store_batch(texts, part, vectors, resp.data)
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                logger.error(
+                    f"Error getting batch embeddings for {len(part)} texts from Ollama: {e}",
+                    exc_info=True,
+                )
+        return self._stack_batch(vectors)
+
+    async def aget_embedding(self, text: str) -> np.ndarray:
+        """
+        Async variant of get_embedding. Returns zeros on error/empty input.
+        """
+        return (await self.aget_embeddings_batch([text]))[0]
+
+    async def aget_embeddings_batch(
+        self, texts: list[str], raise_on_error: bool = False
+    ) -> np.ndarray:
+        """
+        Async variant of get_embeddings_batch; the requests are sent one at a time.
+        Rows for empty input, or for the texts of a failed request, are zeros.
+
+        Args:
+            texts: The texts to embed
+            raise_on_error: Raise on a failed request instead of leaving zero rows
+        """
+        vectors, pending = self._lookup_batch(texts)
+        for part in self._request_slices(pending):
+            try:
+                resp = await self.async_client.embeddings.create(
+                    model=self.model,
+                    input=[texts[i] for i in part],
+                    encoding_format="base64",
+                )
+                self._store_batch(texts, part, vectors, resp.data)
+            except Exception as e:
+                if raise_on_error:
+                    raise
+                logger.error(
+                    f"Error getting batch embeddings for {len(part)} texts from Ollama: {e}",
+                    exc_info=True,
+                )
+        return self._stack_batch(vectors)
+
+    def _request_slices(self, pending: list[int]) -> list[list[int]]:
+        """Split the pending indices into per-request slices of at most batch_size."""
+        return [
+            pending[i : i + self.batch_size]
+            for i in range(0, len(pending), self.batch_size)
+        ]
+
+    def _lookup_batch(
+        self, texts: list[str]
+    ) -> tuple[list[np.ndarray | None], list[int]]:
+        """Fill cached vectors and return the indices that still need a request."""
+        vectors: list[np.ndarray | None] = [None] * len(texts)
+        pending = []
+        for i, text in enumerate(texts):
             if not text or not isinstance(text, str) or not text.strip():
-                dim = self._dimension or 768
-                logger.warning("Empty text for embedding; returning zero vector")
-                return np.zeros(dim)
-
-            resp = self.client.embeddings.create(model=self.model, input=text)
-            vec = resp.data[0].embedding
-            if vec is None:
-                dim = self._dimension or 768
-                logger.error("No embedding returned; using zero vector")
-                return np.zeros(dim)
-
-            # Cache dimension if not set yet
-            if self._dimension is None:
-                self._dimension = len(vec)
-
-            return np.array(vec, dtype=np.float32)
-        except Exception as e:
-            dim = self._dimension or 768
-            logger.error(f"Error getting embedding from Ollama: {e}", exc_info=True)
-            return np.zeros(dim)
+                continue
+            vectors[i] = self._cache_get(text)
+            if vectors[i] is None:
+                pending.append(i)
+        return vectors, pending
+
+    def _store_batch(
+        self,
+        texts: list[str],
+        pending: list[int],
+        vectors: list[np.ndarray | None],
+        data: list[Any],
+    ) -> None:
+        """Decode an embeddings response into vectors and the cache."""
+        for d in data:
+            i = pending[d.index]
+            vectors[i] = self._decode_embedding(d.embedding)
+            self._cache_put(texts[i], vectors[i])
+
+    def _stack_batch(self, vectors: list[np.ndarray | None]) -> np.ndarray:
+        """Stack vectors into a matrix, using zero rows for missing ones."""
+        if self._dimension is None:
+            self._dimension = next((len(v) for v in vectors if v is not None), None)
+
+        dim = self._dimension or 768
+        result = np.zeros((len(vectors), dim), dtype=np.float32)
+        for row, vec in enumerate(vectors):
+            if vec is not None:
+                n = min(len(vec), dim)
+                result[row, :n] = vec[:n]
+        return result
+
+
+class JSONLStorage(BaseStorage):
+    """
+    Memoripy storage backed by an append-only JSONL log serialized with orjson.
+
+    Memoripy calls save_memory_to_history after every added interaction; instead
+    of rewriting the whole history each time, only interactions added since the
+    previous save are appended. The log is compacted (rewritten from the
+    in-memory store, which also captures updated access counts) once it has
+    grown to twice its size after the last compaction.
+    """
+
+    def __init__(self, file_path: str, legacy_json_path: str | None = None):
+        """
+        Initialize the JSONLStorage.
+
+        Args:
+            file_path: Path of the JSONL history log
+            legacy_json_path: Optional JSONStorage file to migrate from on first load
+        """
+        self.file_path = file_path
+        self.legacy_json_path = legacy_json_path
+        self._saved_short = 0
+        self._saved_long = 0
+        self._log_lines = 0
+        self._compacted_lines = 0
+        self._needs_compact = False
+
+    def load_history(self) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+        """Replay the log, letting later records for the same id win."""
+        if not os.path.exists(self.file_path):
+            if self.legacy_json_path and os.path.exists(self.legacy_json_path):
+                logger.info(f"Migrating memory history from {self.legacy_json_path}")
+                short_term, long_term = JSONStorage(
+                    self.legacy_json_path
+                ).load_history()
+                # Nothing is in the log yet, so the first save writes everything
+                self._needs_compact = True
+                return short_term, long_term
+            return [], []
+
+        short_term: dict[str, dict[str, Any]] = {}
+        long_term: dict[str, dict[str, Any]] = {}
+        lines = 0
+        with open(self.file_path, "rb") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    # A crash mid-append can leave a truncated last line
+                    logger.warning(f"Skipping corrupt line in {self.file_path}")
+                    continue
+                lines += 1
+                target = short_term if record.pop("memory") == "short" else long_term
+                target[str(record.get("id", len(target)))] = record
+
+        self._saved_short = len(short_term)
+        self._saved_long = len(long_term)
+        self._log_lines = self._compacted_lines = lines
+        return list(short_term.values()), list(long_term.values())
+
+    def save_memory_to_history(self, memory_store: Any) -> None:
+        """Append interactions added since the last save, compacting when due."""
+        if self._needs_compact or self._log_lines >= 2 * max(self._compacted_lines, 1):
+            self.compact(memory_store)
+            return
+
+        records = [
+            self._short_term_record(memory_store, idx)
+            for idx in range(self._saved_short, len(memory_store.short_term_memory))
+        ]
+        records.extend(
+            {"memory": "long", **interaction}
+            for interaction in memory_store.long_term_memory[self._saved_long :]
+        )
+        if not records:
+            return
+
+        with open(self.file_path, "ab") as f:
+            f.write(b"".join(self._dumps(record) for record in records))
+        self._saved_short = len(memory_store.short_term_memory)
+        self._saved_long = len(memory_store.long_term_memory)
+        self._log_lines += len(records)
+
+    def compact(self, memory_store: Any) -> None:
+        """Atomically rewrite the log from the current state of the memory store."""
+        records = [
+            self._short_term_record(memory_store, idx)
+            for idx in range(len(memory_store.short_term_memory))
+        ]
+        records.extend(
+            {"memory": "long", **interaction}
+            for interaction in memory_store.long_term_memory
+        )
+        _atomic_write(
+            self.file_path, b"".join(self._dumps(record) for record in records)
+        )
+        self._saved_short = len(memory_store.short_term_memory)
+        self._saved_long = len(memory_store.long_term_memory)
+        self._log_lines = self._compacted_lines = len(records)
+        self._needs_compact = False
+        logger.debug(
+            f"Compacted memory history {self.file_path} to {len(records)} records"
+        )
+
+    @staticmethod
+    def _short_term_record(memory_store: Any, idx: int) -> dict[str, Any]:
+        """Build the persisted form of a short-term interaction (same fields as JSONStorage)."""
+        interaction = memory_store.short_term_memory[idx]
+        return {
+            "memory": "short",
+            "id": interaction["id"],
+            "prompt": interaction["prompt"],
+            "output": interaction["output"],
+            "embedding": np.ravel(memory_store.embeddings[idx]),
+            "timestamp": memory_store.timestamps[idx],
+            "access_count": memory_store.access_counts[idx],
+            "concepts": list(memory_store.concepts_list[idx]),
+            "decay_factor": interaction.get("decay_factor", 1.0),
+        }
+
+    @staticmethod
+    def _dumps(record: dict[str, Any]) -> bytes:
+        return orjson.dumps(
+            record, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+        )
 
 
 class AgentMemoryManager:
     """Manages agent memory using the Memoripy library."""
 
-    def __init__(self, participant_identity: str, config: dict[str, Any]):
+    def __init__(
+        self,
+        participant_identity: str,
+        config: dict[str, Any],
+        http_client: httpx.AsyncClient | None = None,
+    ):
         """
         Initialize the AgentMemoryManager.
 
         Args:
             participant_identity: Identifier for the participant
             config: Application configuration
+            http_client: Shared HTTP client for the memory LLM and embedding requests
         """
         self.participant_identity = participant_identity
         self.config = config
         self.memory_config = config["memory"]
+        self._enabled = bool(self.memory_config.get("use", False))
         self.memory_manager = None
+        self.chat_model: ChatCompletionsModel | None = None
+        self.embedding_model: OllamaEmbeddingModel | None = None
+        self._http_client = http_client
+        # Content accessor specialized on the first message shape seen
+        self._extract_fast: Callable[[ChatMessage], Any] | None = None
         self._initialize_memory_manager()
 
     def _initialize_memory_manager(self) -> None:
         """Initialize the Memoripy MemoryManager with model instances."""
-        if not self.memory_config["use"]:
+        if not self._enabled:
             logger.info(
                 f"Memory is disabled in config for {self.participant_identity}. Skipping initialization."
             )
@@ -233,24 +736,44 @@ class AgentMemoryManager:
         logger.info(f"Ensuring memory directory exists: {memory_dir_abs}")
 
         user_memory_file = os.path.join(
+            memory_dir_abs, f"{self.participant_identity}.jsonl"
+        )
+        legacy_memory_file = os.path.join(
             memory_dir_abs, f"{self.participant_identity}.json"
         )
 
         llm_cfg = self.config["llm"]
         embedding_cfg = self.config["embedding"]
 
+        llm_cache_dir = (
+            os.path.join(memory_dir_abs, "llm_cache")
+            if self.memory_config.get("llm_cache_enabled", False)
+            else None
+        )
+
         try:
-            chat_model_instance = ChatCompletionsModel(llm_config=llm_cfg)
+            chat_model_instance = ChatCompletionsModel(
+                llm_config=llm_cfg,
+                cache_dir=llm_cache_dir,
+                http_client=self._http_client,
+                max_concurrency=int(self.memory_config.get("concept_concurrency", 4)),
+            )
+            # MemoryManager probes the embedding dimension itself on construction
             embedding_model_instance = OllamaEmbeddingModel(
-                embedding_config=embedding_cfg
+                embedding_config=embedding_cfg,
+                cache_dir=memory_dir_abs,
+                http_client=self._http_client,
             )
-            embedding_model_instance.initialize_embedding_dimension()
 
             self.memory_manager = MemoryManager(
                 chat_model=chat_model_instance,
                 embedding_model=embedding_model_instance,
-                storage=JSONStorage(user_memory_file),
+                storage=JSONLStorage(
+                    user_memory_file, legacy_json_path=legacy_memory_file
+                ),
             )
+            self.chat_model = chat_model_instance
+            self.embedding_model = embedding_model_instance
             logger.info(
                 f"Initialized MemoryManager for user {self.participant_identity} with storage {user_memory_file}"
             )
@@ -268,7 +791,7 @@ class AgentMemoryManager:
         Args:
             update_chat_ctx_func: Function to update chat context with loaded memory
         """
-        if not self.memory_config.get("use", False):
+        if not self._enabled:
             logger.info(
                 f"Memory is disabled in config for {self.participant_identity}. Skipping load."
             )
@@ -332,14 +855,44 @@ class AgentMemoryManager:
         Returns:
             Extracted text content as a string
         """
-        if not message or not message.content:
+        content = getattr(message, "content", None)
+        if not content:
             return ""
 
+        # ChatMessage content keeps one shape for the whole session, so after
+        # the first message skip the isinstance/hasattr dispatch
+        if self._extract_fast is not None:
+            try:
+                text = self._extract_fast(message)
+                if type(text) is str:
+                    return text
+            except (AttributeError, IndexError, TypeError):
+                pass
+        else:
+            self._extract_fast = self._select_extractor(content)
+
+        return self._extract_content_generic(content)
+
+    @staticmethod
+    def _select_extractor(content: Any) -> Callable[[ChatMessage], Any]:
+        """Pick a direct accessor matching the shape of a message's content."""
+        # Returning None sends a message of a different shape to the generic path
+        if isinstance(content, list):
+            if isinstance(content[0], str):
+                return lambda m: m.content[0] if type(m.content) is list else None
+            if hasattr(content[0], "text"):
+                return lambda m: m.content[0].text
+            return lambda m: str(m.content[0]) if type(m.content) is list else None
+        return lambda m: None if type(m.content) is list else str(m.content)
+
+    @staticmethod
+    def _extract_content_generic(content: Any) -> str:
+        """Extract text from any supported ChatMessage content structure."""
         # Handle different content structures
-        if isinstance(message.content, list):
-            if not message.content:
+        if isinstance(content, list):
+            if not content:
                 return ""
-            content_item = message.content[0]
+            content_item = content[0]
             if isinstance(content_item, str):
                 return content_item
             elif hasattr(content_item, "text"):
@@ -347,7 +900,18 @@ class AgentMemoryManager:
             else:
                 return str(content_item)
         else:
-            return str(message.content)
+            return str(content)
+
+    @staticmethod
+    def _is_trivial(user_prompt: str) -> bool:
+        """
+        Return True when a user turn is only acknowledgement filler ("ok thanks").
+        Short turns with content ("I'm allergic.") are kept, whatever the reply.
+        """
+        words = user_prompt.split()
+        return bool(words) and all(
+            word.lower().strip(".,!?") in _FILLER_WORDS for word in words
+        )
 
     async def save_memory(self, chat_ctx: ChatContext) -> None:
         """
@@ -356,7 +920,7 @@ class AgentMemoryManager:
         Args:
             chat_ctx: ChatContext containing the conversation messages
         """
-        if not self.memory_config.get("use", False):
+        if not self._enabled:
             logger.info(
                 f"Memory is disabled in config for {self.participant_identity}. Skipping save."
             )
@@ -379,68 +943,67 @@ class AgentMemoryManager:
         )
         logger.info(f"Conversation history messages count: {len(chat_ctx.items)}")
 
-        i = 0
         processed_count = 0
-        items = chat_ctx.items
-
-        while i < len(items):
-            user_msg = None
-            assistant_msg = None
-
-            # Find the next user message
-            if items[i].role == "user":
-                user_msg = items[i]
-                # Find the corresponding assistant message (if it exists)
-                if i + 1 < len(items) and items[i + 1].role == "assistant":
-                    assistant_msg = items[i + 1]
-                    i += 2  # Move past both
-                else:
-                    i += 1  # Move past only user msg
-            elif items[i].role == "assistant":
-                # Skip assistant message without preceding user message
-                logger.warning(
-                    f"Skipping assistant message without preceding user message at index {i}"
-                )
-                i += 1
-                continue
-            else:  # Skip system messages etc.
+        # Function calls and their outputs have no role or content; drop them so
+        # a tool-using turn still pairs its user and assistant messages
+        items = [item for item in chat_ctx.items if getattr(item, "role", None)]
+        # Single pre-pass so the pairing loop below only compares strings
+        roles = [item.role for item in items]
+        contents = [
+            self._extract_message_content(item) if role in ("user", "assistant") else ""
+            for item, role in zip(items, roles, strict=True)
+        ]
+        # (user_prompt, assistant_response, combined_text) per interaction pair
+        interactions: list[tuple[str, str, str]] = []
+
+        i = 0
+        n = len(roles)
+        while i < n:
+            role = roles[i]
+            if role != "user":
+                if role == "assistant":
+                    # Skip assistant message without preceding user message
+                    logger.warning(
+                        f"Skipping assistant message without preceding user message at index {i}"
+                    )
+                # Skip system messages etc.
                 i += 1
                 continue
 
-            # Process the interaction pair
-            if user_msg:
-                # Extract content using helper method
-                user_prompt = self._extract_message_content(user_msg)
-                assistant_response = (
-                    self._extract_message_content(assistant_msg)
-                    if assistant_msg
-                    else ""
-                )
+            user_prompt = contents[i]
+            # Pair with the following assistant message (if it exists)
+            if i + 1 < n and roles[i + 1] == "assistant":
+                assistant_response = contents[i + 1]
+                i += 2  # Move past both
+            else:
+                assistant_response = ""
+                i += 1  # Move past only user msg
 
-                combined_text = f"{user_prompt} {assistant_response}".strip()
+            combined_text = f"{user_prompt} {assistant_response}".strip()
+            if not combined_text:
+                logger.debug("Skipping empty interaction.")
+                continue
+            if self._is_trivial(user_prompt):
+                logger.debug(f"Skipping filler-only interaction: {combined_text!r}")
+                continue
 
-                if not combined_text:
-                    logger.debug("Skipping empty interaction.")
-                    continue
+            interactions.append((user_prompt, assistant_response, combined_text))
 
-                try:
-                    concepts = self.memory_manager.extract_concepts(combined_text)
-                    embedding = self.memory_manager.get_embedding(combined_text)
-                    self.memory_manager.add_interaction(
-                        prompt=user_prompt,
-                        output=assistant_response,
-                        embedding=embedding,
-                        concepts=concepts,
-                    )
-                    processed_count += 1
-                    logger.debug(
-                        f"Added interaction to Memoripy: User: '{user_prompt[:50]}...' Assistant: '{assistant_response[:50]}...'"
-                    )
-                except Exception as e:
-                    logger.error(
-                        f"Error processing interaction via Memoripy: {e} for interaction: User='{user_prompt[:50]}...', Assistant='{assistant_response[:50]}...'",
-                        exc_info=True,
-                    )
+        if interactions and self.chat_model and self.embedding_model:
+            # One batched embeddings request and concurrent concept extraction
+            # for the whole conversation instead of two blocking calls per pair
+            texts = [combined_text for _, _, combined_text in interactions]
+            concepts_batch, embeddings = await asyncio.gather(
+                self.chat_model.aextract_concepts_batch(texts),
+                self.embedding_model.aget_embeddings_batch(texts),
+            )
+            # Memoripy persists synchronously on every add, keep it off the loop
+            processed_count = await asyncio.to_thread(
+                self._add_interactions,
+                [(prompt, response) for prompt, response, _ in interactions],
+                concepts_batch,
+                embeddings,
+            )
 
         if processed_count > 0:
             logger.info(
@@ -451,50 +1014,138 @@ class AgentMemoryManager:
                 f"No interactions were added to memory for {self.participant_identity}"
             )
 
+    def _add_interactions(
+        self,
+        entries: list[tuple[str, str]],
+        concepts_batch: list[list[str]],
+        embeddings: np.ndarray,
+    ) -> int:
+        """
+        Add (prompt, output) pairs with precomputed concepts and embeddings to Memoripy.
+
+        Returns:
+            Number of interactions added successfully
+        """
+        if self.memory_manager is None:
+            return 0
+
+        added = 0
+        for (prompt, output), concepts, embedding in zip(
+            entries, concepts_batch, embeddings, strict=True
+        ):
+            try:
+                self.memory_manager.add_interaction(
+                    prompt=prompt,
+                    output=output,
+                    embedding=self.memory_manager.standardize_embedding(embedding),
+                    concepts=concepts,
+                )
+                added += 1
+                logger.debug(
+                    f"Added interaction to Memoripy: User: '{prompt[:50]}...' Assistant: '{output[:50]}...'"
+                )
+            except Exception as e:
+                logger.error(
+                    f"Error processing interaction via Memoripy: {e} for interaction: User='{prompt[:50]}...', Assistant='{output[:50]}...'",
+                    exc_info=True,
+                )
+        return added
+
     async def add_background_knowledge(
-        self, file_id: str, filename: str, content: str
+        self,
+        file_id: str,
+        filename: str,
+        content: str | IO[str],
+        max_chars: int | None = None,
     ) -> None:
         """
         Add background knowledge from uploaded files to the agent's memory.
 
+        The content is split into fixed-size chunks (memory.knowledge_chunk_size),
+        each stored as its own interaction so the whole file stays retrievable.
+        Streams are consumed one embedding batch of chunks at a time.
+
         Args:
             file_id: Unique identifier for the file
             filename: Original filename
-            content: Text content of the file
+            content: Text content of the file, or a text stream to read it from
+            max_chars: Optional cap on the number of characters ingested
         """
-        if not self.memory_config.get("use", False):
+        if not self._enabled:
             logger.info(
                 f"Memory is disabled in config for {self.participant_identity}. Skipping background knowledge."
             )
             return
 
-        if self.memory_manager is None:
+        if (
+            self.memory_manager is None
+            or self.chat_model is None
+            or self.embedding_model is None
+        ):
             logger.warning(
                 f"Memory manager not available for {self.participant_identity}. Cannot add background knowledge."
             )
             return
 
+        chunk_size = int(self.memory_config.get("knowledge_chunk_size", 4000))
+        batch_size = self.embedding_model.batch_size
+
         try:
-            # Create a knowledge prompt to integrate with memory
-            knowledge_prompt = f"[BACKGROUND KNOWLEDGE from {filename}]"
-            knowledge_response = f"I have access to background knowledge from the file '{filename}'. Here's a summary:\n\n{content[:2000]}..."
-
-            # Extract concepts and embeddings
-            combined_text = f"{knowledge_prompt} {knowledge_response}".strip()
-            concepts = self.memory_manager.extract_concepts(combined_text)
-            embedding = self.memory_manager.get_embedding(combined_text)
-
-            # Add to memory as a special interaction
-            self.memory_manager.add_interaction(
-                prompt=knowledge_prompt,
-                output=knowledge_response,
-                embedding=embedding,
-                concepts=concepts,
-            )
+            chunks = self._iter_chunks(content, chunk_size, max_chars)
+            total = added = 0
+            while batch := list(itertools.islice(chunks, batch_size)):
+                # Create knowledge prompts to integrate with memory, one per chunk
+                entries = []
+                for part, chunk in enumerate(batch, start=total + 1):
+                    knowledge_prompt = (
+                        f"[BACKGROUND KNOWLEDGE from {filename}, part {part}]"
+                    )
+                    knowledge_response = f"I have access to background knowledge from the file '{filename}'. Here's an excerpt:\n\n{chunk}"
+                    entries.append((knowledge_prompt, knowledge_response))
+                first, total = total + 1, total + len(batch)
 
-            logger.info(
-                f"Added background knowledge from {filename} (ID: {file_id}) to memory for {self.participant_identity}"
-            )
+                texts = [f"{prompt} {response}".strip() for prompt, response in entries]
+                try:
+                    # A failed embedding request cancels the batch's extractions
+                    async with asyncio.TaskGroup() as tg:
+                        concepts_task = tg.create_task(
+                            self.chat_model.aextract_concepts_batch(texts)
+                        )
+                        embeddings_task = tg.create_task(
+                            self.embedding_model.aget_embeddings_batch(
+                                texts, raise_on_error=True
+                            )
+                        )
+                except Exception as e:
+                    # Skip the batch rather than storing zero embeddings for it
+                    if isinstance(e, ExceptionGroup):
+                        e = e.exceptions[0]
+                    logger.error(
+                        f"Failed to embed parts {first}-{total} of {filename}; skipping them: {e}",
+                        exc_info=True,
+                    )
+                    continue
+
+                # Add to memory as special interactions
+                added += await asyncio.to_thread(
+                    self._add_interactions,
+                    entries,
+                    concepts_task.result(),
+                    embeddings_task.result(),
+                )
+
+            if not total:
+                logger.warning(f"No background knowledge content in {filename}")
+                return
+
+            if added < total:
+                logger.warning(
+                    f"Added only {added} of {total} chunks of background knowledge from {filename} (ID: {file_id}) for {self.participant_identity}"
+                )
+            else:
+                logger.info(
+                    f"Added background knowledge from {filename} (ID: {file_id}) in {total} chunks to memory for {self.participant_identity}"
+                )
 
         except Exception as e:
             logger.error(
@@ -502,6 +1153,30 @@ class AgentMemoryManager:
                 exc_info=True,
             )
 
+    @staticmethod
+    def _iter_chunks(
+        content: str | IO[str], chunk_size: int, max_chars: int | None
+    ) -> Iterator[str]:
+        """Yield non-blank chunks of chunk_size characters from text or a stream."""
+        remaining = max_chars
+        if isinstance(content, str):
+            text = content if remaining is None else content[:remaining]
+            for i in range(0, len(text), chunk_size):
+                chunk = text[i : i + chunk_size]
+                if chunk.strip():
+                    yield chunk
+            return
+
+        while remaining is None or remaining > 0:
+            size = chunk_size if remaining is None else min(chunk_size, remaining)
+            chunk = content.read(size)
+            if not chunk:
+                break
+            if remaining is not None:
+                remaining -= len(chunk)
+            if chunk.strip():
+                yield chunk
+
     def get_relevant_knowledge(self, query: str, max_results: int = 3) -> list[str]:
         """
         Retrieve relevant background knowledge based on a query.
@@ -513,7 +1188,7 @@ class AgentMemoryManager:
         Returns:
             List of relevant knowledge snippets
         """
-        if not self.memory_config.get("use", False) or self.memory_manager is None:
+        if not self._enabled or self.memory_manager is None:
             return []
 
         try:
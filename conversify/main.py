@@ -6,6 +6,7 @@ import sys
 from typing import Any
 
 import aiohttp as _aiohttp
+import httpx
 from dotenv import load_dotenv
 from openai import AsyncClient
 
@@ -23,6 +24,16 @@ def _ClientSession_no_proxy(*args, **kwargs):  # noqa: N802
 
 _aiohttp.ClientSession = _ClientSession_no_proxy
 
+# Use uvloop when available. This runs at import time rather than in main()
+# because job processes re-import this module to unpickle the entrypoint
+# before creating their own event loop.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
 from livekit.agents import (  # noqa: E402
     AgentSession,
     AudioConfig,
@@ -36,6 +47,10 @@ from livekit.agents import (  # noqa: E402
     cli,
 )
 from livekit.agents.types import NOT_GIVEN  # noqa: E402
+
+# Not lazy: plugins register themselves on import, which must happen on the
+# main thread (entrypoints run off it with the thread executor), and the turn
+# detector also registers its inference runner before the worker starts
 from livekit.plugins import noise_cancellation, silero, simli  # noqa: E402
 from livekit.plugins.turn_detector.multilingual import MultilingualModel  # noqa: E402
 
@@ -50,9 +65,17 @@ from conversify.utils.logger import setup_logging  # noqa: E402
 
 logger = logging.getLogger(__name__)
 
+# Config of this job process, set by prewarm so entrypoint can reuse it
+_CACHED_CONFIG: dict[str, Any] | None = None
+
 
-def prewarm(proc: JobProcess, config: dict[str, Any]):
+def prewarm(proc: JobProcess, config: dict[str, Any] | None = None):
     """Prewarms resources needed by the agent, like the VAD model."""
+    global _CACHED_CONFIG
+    if config is None:
+        config = ConfigManager().load_config()
+    _CACHED_CONFIG = config
+
     logger.info("Prewarming VAD...")
     vad_config = config["vad"]
 
@@ -67,9 +90,17 @@ def prewarm(proc: JobProcess, config: dict[str, Any]):
     )
     logger.info("VAD prewarmed successfully.")
 
+    # Start the Whisper model load and warmup now, so the first job in this
+    # process doesn't pay for it
+    logger.info("Prewarming STT...")
+    proc.userdata["stt"] = WhisperSTT(config=config)
+
 
-async def entrypoint(ctx: JobContext, config: dict[str, Any]):
+async def entrypoint(ctx: JobContext, config: dict[str, Any] | None = None):
     """The main entrypoint for the agent job."""
+    if config is None:
+        config = _CACHED_CONFIG or await ConfigManager().aload_config()
+
     # Setup initial logging context
     ctx.log_context_fields = {
         "room": ctx.room.name,
@@ -83,35 +114,51 @@ async def entrypoint(ctx: JobContext, config: dict[str, Any]):
     # Create shared state dictionary for inter-task communication
     shared_state: dict[str, Any] = {}
 
+    # Check if VAD was prewarmed successfully
+    vad = ctx.proc.userdata.get("vad")
+    if not vad:
+        logger.error("VAD not found in process userdata. Exiting.")
+        return
+
+    # One pooled HTTP client shared by the agent LLM, TTS and the memory models,
+    # so keep-alive connections are reused instead of one pool per client.
+    # HTTP/1.1 only: httpx negotiates HTTP/2 solely over TLS, and the model
+    # servers are plain-http local endpoints, so http2=True (and h2) buys nothing
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+    )
+    agent: ConversifyAgent | None = None
+    video_task: asyncio.Task | None = None
+
+    # Register the shutdown callback right away so the client is closed on
+    # every exit path; the lambda sees agent and video_task once they are set
+    ctx.add_shutdown_callback(lambda: shutdown_callback(agent, video_task, http_client))
+    logger.info("Shutdown callback registered.")
+
     # Initialize LLM Client here using config
     llm_config = config["llm"]
     try:
         llm_client = AsyncClient(
-            api_key=llm_config["api_key"], base_url=llm_config["base_url"]
+            api_key=llm_config["api_key"],
+            base_url=llm_config["base_url"],
+            http_client=http_client,
         )
         logger.info(f"Initialized LLM Client at {llm_config['base_url']}")
     except Exception as e:
         logger.error(f"Failed to initialize LLM Client: {e}")
         raise
 
-    # Check if VAD was prewarmed successfully
-    vad = ctx.proc.userdata.get("vad")
-    if not vad:
-        logger.error("VAD not found in process userdata. Exiting.")
-        return
-
     # Setup the AgentSession with configured plugins
     session = AgentSession(
         vad=vad,
         llm=OpenaiLLM(client=llm_client, config=config),
-        stt=WhisperSTT(config=config),
-        tts=KokoroTTS(config=config),
+        stt=ctx.proc.userdata.get("stt") or WhisperSTT(config=config),
+        tts=KokoroTTS(config=config, http_client=http_client),
         turn_detection=MultilingualModel() if config["agent"]["use_eou"] else NOT_GIVEN,
     )
     logger.info("AgentSession created.")
 
     # Start the video processing loop if configured
-    video_task: asyncio.Task | None = None
     vision_config = config["vision"]
 
     if vision_config["use"]:
@@ -137,12 +184,9 @@ async def entrypoint(ctx: JobContext, config: dict[str, Any]):
         participant_identity=participant.identity,
         shared_state=shared_state,
         config=config,
+        http_client=http_client,
     )
 
-    # Register the shutdown callback
-    ctx.add_shutdown_callback(lambda: shutdown_callback(agent, video_task))
-    logger.info("Shutdown callback registered.")
-
     # Add a virtual avatar to the session, if desired
     if config["agent"]["use_avatar"]:
         simli_api_key = os.getenv("SIMLI_API_KEY")
@@ -163,16 +207,16 @@ async def entrypoint(ctx: JobContext, config: dict[str, Any]):
 
         await simli_avatar.start(session, room=ctx.room)
 
+    noise_canceller = None
+    if config["agent"]["use_background_noise_removal"]:
+        noise_canceller = noise_cancellation.BVC()
+
     # Start the agent session
     logger.info("Starting agent session...")
     await session.start(
         agent=agent,
         room=ctx.room,
-        room_input_options=RoomInputOptions(
-            noise_cancellation=noise_cancellation.BVC()
-            if config["agent"]["use_background_noise_removal"]
-            else None,
-        ),
+        room_input_options=RoomInputOptions(noise_cancellation=noise_canceller),
         room_output_options=RoomOutputOptions(transcription_enabled=True),
     )
 
@@ -1,12 +1,16 @@
-import dataclasses
-import io
+import asyncio
+import functools
+import importlib.util
 import logging
 import os
 import platform
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
+import psutil
 import soundfile as sf
 from livekit import rtc
 from livekit.agents import (
@@ -36,8 +40,169 @@ except ImportError:
     OPENAI_WHISPER_AVAILABLE = False
     whisper = None
 
+# Only probe for transformers here: importing it (and torch) is expensive and
+# only needed when the "transformers" backend is actually selected
+TRANSFORMERS_AVAILABLE = (
+    importlib.util.find_spec("transformers") is not None
+    and importlib.util.find_spec("torch") is not None
+)
+
 logger = logging.getLogger(__name__)
 
+# Whisper models expect 16 kHz input and treat raw arrays as such
+WHISPER_SAMPLE_RATE = 16000
+
+# Single background thread for model loads so constructing WhisperSTT or
+# switching models never blocks the event loop
+_MODEL_LOADER = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper-load")
+
+# Default CTranslate2 compute type per device: int8 weights with fp16
+# activations where FP16 hardware exists, plain int8 on CPU
+_DEFAULT_COMPUTE_TYPES = {
+    "cuda": "int8_float16",
+    "metal": "int8_float16",
+    "cpu": "int8",
+}
+
+
+def _load_local_first(loader: Any, *args: Any, **kwargs: Any) -> Any:
+    """Load a model from the local cache, downloading only on a cache miss.
+
+    Skips the Hugging Face Hub round-trip that would otherwise run on every
+    start even when the model is already cached.
+    """
+    try:
+        return loader(*args, local_files_only=True, **kwargs)
+    except OSError:  # includes huggingface_hub's LocalEntryNotFoundError
+        logger.info("Model not found in local cache, downloading it")
+        return loader(*args, local_files_only=False, **kwargs)
+
+
+def _pcm_to_mono_f32(
+    pcm: np.ndarray, channels: int, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Convert interleaved int16 PCM to mono float32 in [-1, 1).
+
+    Downmixing and scaling share one output buffer, so no float64 or
+    per-channel temporaries are created.
+
+    Args:
+        pcm: Interleaved int16 samples
+        channels: Number of interleaved channels
+        out: Optional float32 buffer of exactly len(pcm) // channels samples
+
+    Returns:
+        Mono float32 audio (out, if given)
+    """
+    if channels <= 1:
+        return np.multiply(pcm, np.float32(1.0 / 32768.0), dtype=np.float32, out=out)
+    audio = pcm.reshape(-1, channels).sum(axis=1, dtype=np.float32, out=out)
+    audio *= np.float32(1.0 / (channels * 32768.0))
+    return audio
+
+
+@functools.lru_cache(maxsize=4)
+def _load_warmup(path: str) -> np.ndarray:
+    """Decode a warmup audio file once per process.
+
+    Args:
+        path: Path to the warmup audio file
+
+    Returns:
+        Read-only mono float32 audio, shared by every caller
+    """
+    pcm, _ = sf.read(path, dtype="int16", always_2d=True)
+    audio = _pcm_to_mono_f32(pcm.reshape(-1), pcm.shape[1])
+    audio.setflags(write=False)
+    return audio
+
+
+# Whisper's fixed input length, and how much consecutive transformers windows
+# share so a word cut at a window boundary is heard whole in one of them
+_WINDOW_S = 30
+_WINDOW_OVERLAP_S = 5
+
+
+def _merge_overlap(words: list[str], new_words: list[str]) -> list[str]:
+    """Append a window's words, dropping those repeated from the previous window.
+
+    Args:
+        words: Words transcribed so far
+        new_words: Words of the next (overlapping) window
+
+    Returns:
+        The combined words, with the longest shared run kept once
+    """
+
+    def norm(word: str) -> str:
+        return word.lower().strip(".,!?;:\"'")
+
+    # The 5 s overlap holds far fewer words than this; the cap keeps a
+    # repeated phrase further back from being mistaken for the overlap
+    limit = min(len(words), len(new_words), 32)
+    for k in range(limit, 0, -1):
+        if [norm(w) for w in words[-k:]] == [norm(w) for w in new_words[:k]]:
+            return words + new_words[k:]
+    return words + new_words
+
+
+class _TransformersWhisper:
+    """Hugging Face Whisper model that decodes overlapping 30 s windows in batches."""
+
+    def __init__(
+        self, model: Any, processor: Any, device: str, dtype: Any, batch_size: int
+    ):
+        self.model = model
+        self.processor = processor
+        self.device = device
+        self.dtype = dtype
+        self.batch_size = max(1, batch_size)
+
+    @staticmethod
+    def _windows(audio: np.ndarray) -> list[np.ndarray]:
+        """Split audio into 30 s windows that overlap by _WINDOW_OVERLAP_S."""
+        window = _WINDOW_S * WHISPER_SAMPLE_RATE
+        overlap = _WINDOW_OVERLAP_S * WHISPER_SAMPLE_RATE
+        if len(audio) <= window:
+            return [audio] if len(audio) else []
+        step = window - overlap
+        return [audio[i : i + window] for i in range(0, len(audio) - overlap, step)]
+
+    def transcribe(
+        self, audio: np.ndarray, language: str | None = None, beam_size: int = 1
+    ) -> str:
+        """Transcribe mono 16 kHz audio, batching its overlapping 30 s windows.
+
+        Args:
+            audio: Mono float32 audio at WHISPER_SAMPLE_RATE
+            language: Language of the audio
+            beam_size: Number of beams for generation
+
+        Returns:
+            Transcribed text
+        """
+        import torch
+
+        chunks = self._windows(audio)
+        texts: list[str] = []
+        for start in range(0, len(chunks), self.batch_size):
+            features = self.processor.feature_extractor(
+                chunks[start : start + self.batch_size],
+                sampling_rate=WHISPER_SAMPLE_RATE,
+                return_tensors="pt",
+            ).input_features.to(self.device, dtype=self.dtype)
+            with torch.inference_mode():
+                token_ids = self.model.generate(
+                    features, language=language, task="transcribe", num_beams=beam_size
+                )
+            texts.extend(
+                self.processor.batch_decode(token_ids, skip_special_tokens=True)
+            )
+        words: list[str] = []
+        for text in texts:
+            words = _merge_overlap(words, text.split())
+        return " ".join(words)
+
 
 @dataclass
 class WhisperOptions:
@@ -45,7 +210,7 @@ class WhisperOptions:
 
     language: str
     model: WhisperModels | str
-    backend: str = "faster-whisper"  # "faster-whisper" or "openai"
+    backend: str = "faster-whisper"  # "faster-whisper", "openai" or "transformers"
     device: str | None = None
     compute_type: str | None = None
     model_cache_directory: str | None = None
@@ -57,8 +222,12 @@ class WhisperOptions:
     word_timestamps: bool = False
     vad_filter: bool = False
     vad_min_silence_ms: int = 500
-    condition_on_previous_text: bool = True
+    # Each buffer is an independent utterance; conditioning on the previous
+    # one lengthens the prompt and invites hallucination loops on silence
+    condition_on_previous_text: bool = False
     initial_prompt: str | None = None
+    quantize_cpu: bool = False  # openai backend: int8 dynamic quantization on CPU
+    batch_size: int = 8  # transformers backend: windows per forward pass
 
 
 class WhisperSTT(stt.STT):
@@ -83,6 +252,11 @@ class WhisperSTT(stt.STT):
         compute_type = stt_config["compute_type"]
         model_cache_directory = stt_config["model_cache_directory"]
         warmup_audio = stt_config["warmup_audio"]
+        quantize_cpu = bool(stt_config.get("quantize_cpu", False))
+        batch_size = int(stt_config.get("batch_size", 8))
+        condition_on_previous_text = bool(
+            stt_config.get("condition_on_previous_text", False)
+        )
 
         self._opts = WhisperOptions(
             language=language,
@@ -92,6 +266,9 @@ class WhisperSTT(stt.STT):
             compute_type=compute_type,
             model_cache_directory=model_cache_directory,
             warmup_audio=warmup_audio,
+            quantize_cpu=quantize_cpu,
+            batch_size=batch_size,
+            condition_on_previous_text=condition_on_previous_text,
         )
 
         # Validate backend availability
@@ -103,17 +280,31 @@ class WhisperSTT(stt.STT):
             raise ImportError(
                 "openai-whisper is not available. Install it with: pip install openai-whisper"
             )
-        elif self._opts.backend not in ["faster-whisper", "openai"]:
+        elif self._opts.backend == "transformers" and not TRANSFORMERS_AVAILABLE:
+            raise ImportError(
+                "transformers is not available. Install it with: pip install 'conversify[transformers]'"
+            )
+        elif self._opts.backend not in ["faster-whisper", "openai", "transformers"]:
             raise ValueError(
-                f"Unsupported backend: {self._opts.backend}. Use 'faster-whisper' or 'openai'"
+                f"Unsupported backend: {self._opts.backend}. Use 'faster-whisper', 'openai' or 'transformers'"
             )
 
+        # Load and warm up the model in the background; recognition waits on
+        # this future only until the first model is in place
         self._model = None
-        self._initialize_model()
-
-        # Warmup the model with a sample audio if available
-        if warmup_audio and os.path.exists(warmup_audio):
-            self._warmup(warmup_audio)
+        # Reusable float32 buffer for the mono audio; the lock keeps concurrent
+        # recognitions from sharing it (and the model) at the same time. It is
+        # a thread lock held by the worker thread itself, so cancelling a
+        # recognition can't release it while its inference is still running.
+        self._mono_scratch: np.ndarray | None = None
+        # openai-whisper decodes in fp16 only where it is supported (CUDA)
+        self._use_fp16 = False
+        self._inference_lock = threading.Lock()
+        # Resamplers to 16 kHz, keyed by (input sample rate, channels)
+        self._resamplers: dict[tuple[int, int], rtc.AudioResampler] = {}
+        self._ready: Future = _MODEL_LOADER.submit(self._load_model)
+        # Latest update_options reload, kept so its outcome is not dropped
+        self._reload: Future | None = None
 
     def _default_device(self, device_cfg: str | None = None) -> str:
         if device_cfg:
@@ -131,24 +322,65 @@ class WhisperSTT(stt.STT):
     def _default_compute(self, compute_cfg: str | None, device: str) -> str:
         if compute_cfg:
             return compute_cfg
-        if device == "metal":
-            return "int8_float16"
-        return "int8"
+        return _DEFAULT_COMPUTE_TYPES.get(device, "int8")
+
+    def _load_model(self) -> Any:
+        """Initialize and warm up a model, then swap it in (runs on the loader thread).
+
+        Returns:
+            The loaded model
+        """
+        try:
+            with FindTime("STT_model_load"):
+                model = self._initialize_model()
+
+            # Warmup the model with a sample audio if available
+            warmup_audio = self._opts.warmup_audio
+            if warmup_audio and os.path.exists(warmup_audio):
+                self._warmup(warmup_audio, model)
+        except Exception as e:
+            logger.error("Failed to load Whisper model: %s", e, exc_info=True)
+            raise
+
+        # The previous model keeps serving requests until this assignment
+        self._model = model
+        return model
+
+    def _default_cpu_threads(self, threads_cfg: int | None = None) -> int:
+        """Pick the CTranslate2 intra-op thread count.
+
+        Letting CTranslate2 use every logical CPU oversubscribes SMT hosts and
+        containers with a restricted CPU set, so clamp to the physical cores
+        this process may actually run on.
+        """
+        if threads_cfg:
+            return threads_cfg
+        physical = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+        if hasattr(os, "sched_getaffinity"):
+            physical = min(physical, len(os.sched_getaffinity(0)))
+        return max(1, min(physical, 8))
+
+    def _initialize_model(self) -> Any:
+        """Initialize the Whisper model.
 
-    def _initialize_model(self):
-        """Initialize the Whisper model."""
-        logger.info(f"Initializing Whisper model with backend: {self._opts.backend}")
+        Returns:
+            The loaded model
+        """
+        logger.info("Initializing Whisper model with backend: %s", self._opts.backend)
 
         if self._opts.backend == "faster-whisper":
-            self._initialize_faster_whisper()
+            model = self._initialize_faster_whisper()
         elif self._opts.backend == "openai":
-            self._initialize_openai_whisper()
+            model = self._initialize_openai_whisper()
+        elif self._opts.backend == "transformers":
+            model = self._initialize_transformers_whisper()
         else:
             raise ValueError(f"Unsupported backend: {self._opts.backend}")
 
         logger.info("Whisper model loaded successfully")
+        return model
 
-    def _initialize_faster_whisper(self):
+    def _initialize_faster_whisper(self) -> Any:
         """Initialize faster-whisper model."""
         if WhisperModel is None:
             raise ImportError("faster-whisper is not available")
@@ -156,7 +388,14 @@ class WhisperSTT(stt.STT):
         device = self._default_device(self._opts.device)
         compute_type = self._default_compute(self._opts.compute_type, device)
 
-        logger.info(f"Using device: {device}, with compute: {compute_type}")
+        cpu_threads = self._default_cpu_threads(self._opts.cpu_threads)
+
+        logger.info(
+            "Using device: %s, with compute: %s, cpu threads: %s",
+            device,
+            compute_type,
+            cpu_threads,
+        )
 
         # Ensure cache directories exist
         model_cache_dir = (
@@ -167,18 +406,19 @@ class WhisperSTT(stt.STT):
 
         if model_cache_dir:
             os.makedirs(model_cache_dir, exist_ok=True)
-            logger.info(f"Using model cache directory: {model_cache_dir}")
+            logger.info("Using model cache directory: %s", model_cache_dir)
 
-        self._model = WhisperModel(
+        return _load_local_first(
+            WhisperModel,
             model_size_or_path=str(self._opts.model),
             device=device,
             compute_type=compute_type,
             download_root=model_cache_dir,
-            cpu_threads=self._opts.cpu_threads or 0,
+            cpu_threads=cpu_threads,
             num_workers=self._opts.num_workers or 1,
         )
 
-    def _initialize_openai_whisper(self):
+    def _initialize_openai_whisper(self) -> Any:
         """Initialize OpenAI whisper model."""
         if whisper is None:
             raise ImportError("openai-whisper is not available")
@@ -188,7 +428,8 @@ class WhisperSTT(stt.STT):
         if device == "metal":
             device = "cuda"  # OpenAI whisper doesn't support Metal directly
 
-        logger.info(f"Using device: {device}")
+        self._use_fp16 = device == "cuda"
+        logger.info("Using device: %s, fp16: %s", device, self._use_fp16)
 
         # Ensure cache directories exist
         model_cache_dir = (
@@ -199,48 +440,123 @@ class WhisperSTT(stt.STT):
 
         if model_cache_dir:
             os.makedirs(model_cache_dir, exist_ok=True)
-            logger.info(f"Using model cache directory: {model_cache_dir}")
+            logger.info("Using model cache directory: %s", model_cache_dir)
             # Set the cache directory for OpenAI whisper
             os.environ["WHISPER_CACHE_DIR"] = model_cache_dir
 
-        self._model = whisper.load_model(str(self._opts.model), device=device)
+        model = whisper.load_model(str(self._opts.model), device=device)
+
+        if device == "cpu" and self._opts.quantize_cpu:
+            import torch  # installed alongside openai-whisper
+
+            # int8 weights for the Linear layers; activations stay fp32
+            model = torch.ao.quantization.quantize_dynamic(
+                model, {torch.nn.Linear}, dtype=torch.qint8
+            )
+            logger.info("Applied int8 dynamic quantization to OpenAI whisper")
+
+        return model
+
+    def _initialize_transformers_whisper(self) -> Any:
+        """Initialize a Hugging Face transformers Whisper model."""
+        if not TRANSFORMERS_AVAILABLE:
+            raise ImportError("transformers is not available")
+
+        import torch
+        from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor
+
+        device = self._default_device(self._opts.device)
+        if device == "metal":
+            device = "mps"  # torch's name for the Apple GPU backend
+
+        if device == "cuda":
+            dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+        elif device == "mps":
+            dtype = torch.float16
+        else:
+            dtype = torch.float32
+
+        # FlashAttention 2 needs its CUDA extension; SDPA is the fused fallback
+        attn_implementation = (
+            "flash_attention_2"
+            if device == "cuda" and importlib.util.find_spec("flash_attn") is not None
+            else "sdpa"
+        )
+
+        logger.info(
+            "Using device: %s, dtype: %s, attention: %s",
+            device,
+            dtype,
+            attn_implementation,
+        )
+
+        # Ensure cache directories exist
+        model_cache_dir = (
+            os.path.expanduser(self._opts.model_cache_directory)
+            if self._opts.model_cache_directory
+            else None
+        )
+
+        if model_cache_dir:
+            os.makedirs(model_cache_dir, exist_ok=True)
+            logger.info("Using model cache directory: %s", model_cache_dir)
+
+        model_id = str(self._opts.model)
+        model = _load_local_first(
+            AutoModelForSpeechSeq2Seq.from_pretrained,
+            model_id,
+            torch_dtype=dtype,
+            attn_implementation=attn_implementation,
+            cache_dir=model_cache_dir,
+            low_cpu_mem_usage=True,
+        ).to(device)
+        model.eval()
+        processor = _load_local_first(
+            AutoProcessor.from_pretrained, model_id, cache_dir=model_cache_dir
+        )
 
-    def _warmup(self, warmup_audio_path: str) -> None:
+        return _TransformersWhisper(
+            model, processor, device, dtype, batch_size=self._opts.batch_size
+        )
+
+    def _warmup(self, warmup_audio_path: str, model: Any) -> None:
         """Performs a warmup transcription.
 
         Args:
             warmup_audio_path: Path to audio file for warmup
+            model: Model to warm up
         """
-        logger.info(f"Starting STT engine warmup using {warmup_audio_path}...")
+        logger.info("Starting STT engine warmup using %s...", warmup_audio_path)
         try:
             with FindTime("STT_warmup"):
-                audio, _ = sf.read(warmup_audio_path, dtype="float32")
-                if audio.ndim > 1:
-                    audio = np.mean(audio, axis=1)
+                audio = _load_warmup(warmup_audio_path)
 
                 if self._opts.backend == "faster-whisper":
-                    if self._model is None:
-                        raise RuntimeError("Faster-whisper model not initialized")
-                    segments, _ = self._model.transcribe(
+                    segments, _ = model.transcribe(
                         audio,
                         language=self._opts.language,
                         beam_size=self._opts.beam_size,
                     )
                     text = " ".join(s.text for s in segments)
+                elif self._opts.backend == "transformers":
+                    text = model.transcribe(
+                        audio,
+                        language=self._opts.language,
+                        beam_size=self._opts.beam_size,
+                    )
                 else:  # openai
-                    if self._model is None:
-                        raise RuntimeError("OpenAI whisper model not initialized")
-                    result = self._model.transcribe(
+                    result = model.transcribe(
                         audio,
                         language=self._opts.language,
                         beam_size=self._opts.beam_size,
                         best_of=self._opts.best_of,
+                        fp16=self._use_fp16,
                     )
                     text = result.get("text", "") if isinstance(result, dict) else ""
 
-            logger.info(f"STT engine warmed up. Text: {text}")
+            logger.info("STT engine warmed up. Text: %s", text)
         except Exception as e:
-            logger.error(f"Failed to warm up STT engine: {e}")
+            logger.error("Failed to warm up STT engine: %s", e)
 
     def update_options(
         self,
@@ -270,21 +586,143 @@ class WhisperSTT(stt.STT):
             self._opts.language = language
 
         if reinitialize:
-            self._initialize_model()
+            # Build and warm up the new model in the background; the current
+            # one keeps serving until it is swapped in
+            self._reload = _MODEL_LOADER.submit(self._load_model)
+            self._reload.add_done_callback(self._log_reload_failure)
 
-    def _sanitize_options(self, *, language: str | None = None) -> WhisperOptions:
-        """Create a copy of options with optional overrides.
+    @staticmethod
+    def _log_reload_failure(future: Future) -> None:
+        """Report a failed background reload, which nothing else waits on.
 
         Args:
-            language: Language override
+            future: The finished reload future
+        """
+        if future.cancelled():
+            return
+        exc = future.exception()
+        if exc is not None:
+            # _load_model already logged the traceback
+            logger.error(
+                "Whisper model reload failed, keeping the current model: %s", exc
+            )
+
+    def _resample(self, frame: rtc.AudioFrame) -> rtc.AudioFrame:
+        """Resample a frame to Whisper's 16 kHz input rate.
+
+        Args:
+            frame: Audio frame at any sample rate
 
         Returns:
-            Copy of options with overrides applied
+            Audio frame at WHISPER_SAMPLE_RATE
         """
-        options = dataclasses.replace(self._opts)
-        if language:
-            options.language = language
-        return options
+        key = (frame.sample_rate, frame.num_channels)
+        resampler = self._resamplers.get(key)
+        if resampler is None:
+            resampler = self._resamplers[key] = rtc.AudioResampler(
+                frame.sample_rate,
+                WHISPER_SAMPLE_RATE,
+                num_channels=frame.num_channels,
+                quality=rtc.AudioResamplerQuality.HIGH,
+            )
+        # push and flush run back to back on the event loop, so recognitions
+        # sharing a resampler never interleave their audio
+        frames = resampler.push(frame)
+        frames.extend(resampler.flush())
+        return rtc.combine_audio_frames(frames)
+
+    def _scratch(self, n: int) -> np.ndarray:
+        """Return an n-sample view of the scratch buffer, growing it if needed.
+
+        Only call while holding the inference lock.
+        """
+        scratch = self._mono_scratch
+        if scratch is None or len(scratch) < n:
+            # Grow geometrically so slowly increasing utterances reallocate rarely
+            size = n if scratch is None else max(n, 2 * len(scratch))
+            scratch = self._mono_scratch = np.empty(size, dtype=np.float32)
+        return scratch[:n]
+
+    def _transcribe_pcm(
+        self, data: Any, num_channels: int, language: str | None
+    ) -> str:
+        """Convert int16 PCM to mono float32 and transcribe it (called off the event loop).
+
+        Args:
+            data: Interleaved int16 PCM
+            num_channels: Number of interleaved channels
+            language: Language of the audio
+
+        Returns:
+            Transcribed text
+        """
+        with self._inference_lock:
+            # Frames already hold interleaved int16 PCM; convert it directly
+            # instead of encoding a WAV only to parse it back
+            pcm = np.frombuffer(data, dtype=np.int16)
+            audio = _pcm_to_mono_f32(
+                pcm,
+                num_channels,
+                out=self._scratch(len(pcm) // max(num_channels, 1)),
+            )
+            return self._transcribe(audio, language)
+
+    def _transcribe(self, audio: np.ndarray, language: str | None) -> str:
+        """Run a blocking transcription and collect its text (called off the event loop).
+
+        Args:
+            audio: Mono float32 audio
+            language: Language of the audio
+
+        Returns:
+            Transcribed text
+        """
+        # Snapshot the model so a concurrent swap cannot change it mid-call
+        model = self._model
+
+        with FindTime("STT_inference"):
+            if self._opts.backend == "faster-whisper":
+                if model is None:
+                    raise RuntimeError("Faster-whisper model not initialized")
+                segments, _ = model.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=self._opts.beam_size,
+                    best_of=self._opts.best_of,
+                    condition_on_previous_text=self._opts.condition_on_previous_text,
+                    vad_filter=self._opts.vad_filter,
+                    vad_parameters={
+                        "min_silence_duration_ms": self._opts.vad_min_silence_ms
+                    },
+                    word_timestamps=self._opts.word_timestamps,
+                    initial_prompt=self._opts.initial_prompt,
+                )
+                # Segments is a lazy generator that drives decoding, so
+                # consume it here to keep decode time inside STT_inference
+                parts = [s.text.strip() for s in segments]
+                return " ".join(p for p in parts if p)
+            elif self._opts.backend == "transformers":
+                if model is None:
+                    raise RuntimeError("Transformers whisper model not initialized")
+                return model.transcribe(
+                    audio, language=language, beam_size=self._opts.beam_size
+                )
+            else:  # openai
+                if model is None:
+                    raise RuntimeError("OpenAI whisper model not initialized")
+                result = model.transcribe(
+                    audio,
+                    language=language,
+                    beam_size=self._opts.beam_size,
+                    best_of=self._opts.best_of,
+                    condition_on_previous_text=self._opts.condition_on_previous_text,
+                    word_timestamps=self._opts.word_timestamps,
+                    initial_prompt=self._opts.initial_prompt,
+                    fp16=self._use_fp16,
+                )
+                return (
+                    result.get("text", "").strip() if isinstance(result, dict) else ""
+                )
 
     async def _recognize_impl(
         self,
@@ -308,56 +746,30 @@ class WhisperSTT(stt.STT):
         if language is not NOT_GIVEN:
             lang = str(language) if language is not None else None
         try:
-            logger.info("Received audio, transcribing to text")
-            options = self._sanitize_options(language=lang)
-            wav_bytes = rtc.combine_audio_frames(buffer).to_wav_bytes()
-
-            # Parse WAV from bytes (don't np.frombuffer raw!)
-            audio, sr = sf.read(io.BytesIO(wav_bytes), dtype="float32")
-            if audio.ndim > 1:  # downmix to mono
-                audio = np.mean(audio, axis=1)
+            if self._model is None:
+                await asyncio.wrap_future(self._ready)
 
-            with FindTime("STT_inference"):
-                if self._opts.backend == "faster-whisper":
-                    if self._model is None:
-                        raise RuntimeError("Faster-whisper model not initialized")
-                    segments, info = self._model.transcribe(
-                        audio,
-                        language=options.language,
-                        beam_size=self._opts.beam_size,
-                        best_of=self._opts.best_of,
-                        condition_on_previous_text=self._opts.condition_on_previous_text,
-                        vad_filter=self._opts.vad_filter,
-                        vad_parameters={
-                            "min_silence_duration_ms": self._opts.vad_min_silence_ms
-                        },
-                        word_timestamps=self._opts.word_timestamps,
-                        initial_prompt=self._opts.initial_prompt,
-                    )
-                    full_text = " ".join(s.text.strip() for s in segments)
-                else:  # openai
-                    if self._model is None:
-                        raise RuntimeError("OpenAI whisper model not initialized")
-                    result = self._model.transcribe(
-                        audio,
-                        language=options.language,
-                        beam_size=self._opts.beam_size,
-                        best_of=self._opts.best_of,
-                        condition_on_previous_text=self._opts.condition_on_previous_text,
-                        word_timestamps=self._opts.word_timestamps,
-                        initial_prompt=self._opts.initial_prompt,
-                    )
-                    full_text = (
-                        result.get("text", "").strip()
-                        if isinstance(result, dict)
-                        else ""
-                    )
+            logger.info("Received audio, transcribing to text")
+            # Per-request language override; the shared options are never copied
+            language_used = lang or self._opts.language
+            combined = rtc.combine_audio_frames(buffer)
+            if combined.sample_rate != WHISPER_SAMPLE_RATE:
+                combined = self._resample(combined)
+
+            # Inference blocks for the whole decode; run it on a worker
+            # thread so other sessions' coroutines keep running
+            full_text = await asyncio.to_thread(
+                self._transcribe_pcm,
+                combined.data,
+                combined.num_channels,
+                language_used,
+            )
             return stt.SpeechEvent(
                 type=stt.SpeechEventType.FINAL_TRANSCRIPT,
                 alternatives=[
-                    stt.SpeechData(text=full_text or "", language=options.language)
+                    stt.SpeechData(text=full_text or "", language=language_used)
                 ],
             )
         except Exception as e:
-            logger.error(f"Error in speech recognition: {e}", exc_info=True)
+            logger.error("Error in speech recognition: %s", e, exc_info=True)
             raise APIConnectionError() from e
@@ -25,6 +25,12 @@ logger = logging.getLogger(__name__)
 
 TTS_SAMPLE_RATE = 24000
 TTS_CHANNELS = 1
+# Read the PCM stream in ~100 ms pieces (s16le): far fewer emitter pushes than
+# httpx's small default chunks while keeping time-to-first-audio low
+TTS_READ_CHUNK_BYTES = TTS_SAMPLE_RATE * TTS_CHANNELS * 2 // 10
+
+
+TTS_TIMEOUT = httpx.Timeout(connect=15.0, read=5.0, write=5.0, pool=5.0)
 
 
 @dataclass
@@ -39,6 +45,7 @@ class KokoroTTS(tts.TTS):
         self,
         config: dict[str, Any],
         client: openai.AsyncClient | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ) -> None:
         tts_config = config["tts"]["kokoro"]
 
@@ -48,7 +55,7 @@ class KokoroTTS(tts.TTS):
         api_key = tts_config["api_key"]
         base_url = tts_config["base_url"]
 
-        logger.info(f"Using TTS API URL: {base_url}")
+        logger.info("Using TTS API URL: %s", base_url)
 
         super().__init__(
             capabilities=tts.TTSCapabilities(streaming=False),
@@ -69,12 +76,17 @@ class KokoroTTS(tts.TTS):
 
         self._opts = KokoroTTSOptions(model=model, voice=voice, speed=speed)
 
+        # Reuse the session's HTTP pool when given; its owner closes it. The
+        # timeout is applied per request, so it holds on a shared pool too
+        self._owns_client = client is None and http_client is None
         self._client = client or openai.AsyncClient(
             max_retries=0,
             api_key=api_key,
             base_url=base_url,
-            http_client=httpx.AsyncClient(
-                timeout=httpx.Timeout(connect=15.0, read=5.0, write=5.0, pool=5.0),
+            timeout=TTS_TIMEOUT,
+            http_client=http_client
+            or httpx.AsyncClient(
+                timeout=TTS_TIMEOUT,
                 follow_redirects=True,
                 limits=httpx.Limits(
                     max_connections=50,
@@ -108,6 +120,11 @@ class KokoroTTS(tts.TTS):
         # extra kwargs (like opts=, client=) will break ChunkedStream.__init__.
         return KokoroTTSStream(tts=self, input_text=text, conn_options=conn_options)
 
+    async def aclose(self) -> None:
+        """Close the default client; a client or pool passed in is left to its owner."""
+        if self._owns_client:
+            await self._client.close()
+
 
 class KokoroTTSStream(tts.ChunkedStream):
     def __init__(
@@ -150,7 +167,9 @@ class KokoroTTSStream(tts.ChunkedStream):
                         num_channels=TTS_CHANNELS,
                         mime_type="audio/pcm",
                     )
-                    async for data in stream.iter_bytes():
+                    async for data in stream.iter_bytes(
+                        chunk_size=TTS_READ_CHUNK_BYTES
+                    ):
                         output_emitter.push(data)
 
             logger.info("KokoroTTSStream done: req=%s", request_id)
@@ -0,0 +1,97 @@
+import copy
+import os
+import pickle
+
+import pytest
+
+from conversify.utils.config import ConfigManager, FrozenDict
+
+
+def write_config(tmp_path, greeting="Hello"):
+    prompt_path = tmp_path / "prompt.txt"
+    if not prompt_path.exists():
+        prompt_path.write_text("You are a test agent.\n")
+    config_path = tmp_path / "config.toml"
+    config_path.write_text(
+        f'[agent]\ninstructions_file = "{prompt_path}"\ngreeting = "{greeting}"\n'
+    )
+    return config_path, prompt_path
+
+
+def touch_later(path):
+    # Rewrites within one timestamp tick can keep the mtime; move it forward
+    mtime_ns = os.stat(path).st_mtime_ns + 1_000_000_000
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_unchanged_files_return_cached_config(tmp_path):
+    config_path, _ = write_config(tmp_path)
+
+    first = ConfigManager(str(config_path)).load_config()
+    second = ConfigManager(str(config_path)).load_config()
+    assert second is first
+
+
+def test_config_change_reloads(tmp_path):
+    config_path, _ = write_config(tmp_path)
+    first = ConfigManager(str(config_path)).load_config()
+    assert first["agent"]["greeting"] == "Hello"
+
+    write_config(tmp_path, greeting="Welcome")
+    touch_later(config_path)
+    second = ConfigManager(str(config_path)).load_config()
+    assert second is not first
+    assert second["agent"]["greeting"] == "Welcome"
+
+
+def test_prompt_change_reloads_instructions(tmp_path):
+    config_path, prompt_path = write_config(tmp_path)
+    first = ConfigManager(str(config_path)).load_config()
+    assert first["agent"]["instructions"] == "You are a test agent."
+
+    prompt_path.write_text("  You are an updated agent.\n")
+    touch_later(prompt_path)
+    second = ConfigManager(str(config_path)).load_config()
+    assert second["agent"]["instructions"] == "You are an updated agent."
+
+
+def test_loaded_config_is_read_only(tmp_path):
+    config_path, _ = write_config(tmp_path)
+    config = ConfigManager(str(config_path)).load_config()
+
+    mutations = [
+        lambda: config.__setitem__("agent", {}),
+        lambda: config["agent"].__setitem__("greeting", "Hi"),
+        lambda: config["agent"].update(greeting="Hi"),
+        lambda: config["agent"].pop("greeting"),
+        lambda: config.setdefault("extra", {}),
+        lambda: config.clear(),
+    ]
+    for mutate in mutations:
+        with pytest.raises(TypeError):
+            mutate()
+    with pytest.raises(TypeError):
+        del config["agent"]
+    assert config["agent"]["greeting"] == "Hello"
+
+
+def test_lists_are_frozen_to_tuples(tmp_path):
+    config_path, _ = write_config(tmp_path)
+    with open(config_path, "a") as f:
+        f.write('[vision]\nsources = ["camera", "screen"]\n')
+    config = ConfigManager(str(config_path)).load_config()
+
+    assert config["vision"]["sources"] == ("camera", "screen")
+
+
+def test_config_survives_pickle_and_deepcopy(tmp_path):
+    config_path, _ = write_config(tmp_path)
+    config = ConfigManager(str(config_path)).load_config()
+
+    # The config is pickled into job processes through the entrypoint partials
+    for restored in (pickle.loads(pickle.dumps(config)), copy.deepcopy(config)):
+        assert restored == config
+        assert isinstance(restored, FrozenDict)
+        assert isinstance(restored["agent"], FrozenDict)
+        with pytest.raises(TypeError):
+            restored["agent"]["greeting"] = "Hi"
@@ -0,0 +1,161 @@
+import numpy as np
+import pytest
+from livekit.agents.llm import (
+    ChatContext,
+    ChatMessage,
+    FunctionCall,
+    FunctionCallOutput,
+)
+
+import conversify.core.memory as mod
+from conversify.core.memory import AgentMemoryManager, ChatCompletionsModel
+
+
+class FakeChatModel:
+    def __init__(self, **kwargs):
+        pass
+
+    async def aextract_concepts_batch(self, texts):
+        return [["concept"] for _ in texts]
+
+
+class FakeEmbeddingModel:
+    def __init__(self, **kwargs):
+        pass
+
+    async def aget_embeddings_batch(self, texts, raise_on_error=False):
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+class FakeChain:
+    def __init__(self, response):
+        self.response = response
+        self.calls = 0
+
+    def invoke(self, inputs):
+        self.calls += 1
+        return self.response
+
+    async def ainvoke(self, inputs):
+        return self.invoke(inputs)
+
+
+def make_chat_model(tmp_path, response, model="model-a"):
+    llm_config = {"base_url": "http://localhost:1/v1", "api_key": "x", "model": model}
+    chat_model = ChatCompletionsModel(llm_config, cache_dir=str(tmp_path))
+    chat_model.chain = FakeChain(response)
+    return chat_model
+
+
+class FakeMemoryManager:
+    def __init__(self, **kwargs):
+        self.added = []
+
+    def standardize_embedding(self, embedding):
+        return embedding
+
+    def add_interaction(self, prompt, output, embedding, concepts):
+        self.added.append((prompt, output))
+
+
+@pytest.fixture
+def memory(monkeypatch, tmp_path):
+    monkeypatch.setattr(mod, "ChatCompletionsModel", FakeChatModel)
+    monkeypatch.setattr(mod, "OllamaEmbeddingModel", FakeEmbeddingModel)
+    monkeypatch.setattr(mod, "MemoryManager", FakeMemoryManager)
+    config = {
+        "memory": {"use": True, "dir_abs": str(tmp_path)},
+        "llm": {},
+        "embedding": {},
+    }
+    return AgentMemoryManager("user", config)
+
+
+@pytest.mark.asyncio
+async def test_save_memory_skips_function_call_items(memory):
+    chat_ctx = ChatContext(
+        [
+            ChatMessage(role="user", content=["What's the weather in Paris today?"]),
+            FunctionCall(call_id="call_1", name="get_weather", arguments="{}"),
+            FunctionCallOutput(
+                call_id="call_1", name="get_weather", output="sunny", is_error=False
+            ),
+            ChatMessage(role="assistant", content=["It is sunny in Paris."]),
+        ]
+    )
+
+    await memory.save_memory(chat_ctx)
+
+    assert memory.memory_manager.added == [
+        ("What's the weather in Paris today?", "It is sunny in Paris.")
+    ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("user_prompt", "assistant_response", "kept"),
+    [
+        ("I'm allergic.", "Noted.", True),
+        ("Peanuts.", "Noted.", True),
+        ("Paris", "Paris it is.", True),
+        ("Ok thanks!", "You're welcome!", False),
+        ("yeah, got it", "Great.", False),
+        ("Hi", "Hello! How can I help?", False),
+    ],
+)
+async def test_save_memory_skips_filler_only_turns(
+    memory, user_prompt, assistant_response, kept
+):
+    chat_ctx = ChatContext(
+        [
+            ChatMessage(role="user", content=[user_prompt]),
+            ChatMessage(role="assistant", content=[assistant_response]),
+        ]
+    )
+
+    await memory.save_memory(chat_ctx)
+
+    expected = [(user_prompt, assistant_response)] if kept else []
+    assert memory.memory_manager.added == expected
+
+
+@pytest.mark.asyncio
+async def test_concept_cache_hit_skips_llm(tmp_path):
+    chat_model = make_chat_model(tmp_path, {"concepts": [" Paris ", "", 3]})
+
+    assert await chat_model.aextract_concepts("Trip to Paris") == ["Paris"]
+    assert chat_model.extract_concepts("Trip to Paris") == ["Paris"]
+    assert chat_model.chain.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_concept_cache_miss_calls_llm(tmp_path):
+    chat_model = make_chat_model(tmp_path, {"concepts": ["Paris"]})
+
+    await chat_model.aextract_concepts("Trip to Paris")
+    await chat_model.aextract_concepts("Trip to Rome")
+    assert chat_model.chain.calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", ["not json", ["Paris"], {"concepts": "Paris"}])
+async def test_malformed_response_is_not_cached(tmp_path, response):
+    chat_model = make_chat_model(tmp_path, response)
+
+    assert await chat_model.aextract_concepts("Trip to Paris") == []
+    assert chat_model.extract_concepts("Trip to Paris") == []
+    assert list(tmp_path.iterdir()) == []
+
+    # A later good response is fetched rather than served a cached empty list
+    chat_model.chain = FakeChain({"concepts": ["Paris"]})
+    assert await chat_model.aextract_concepts("Trip to Paris") == ["Paris"]
+
+
+def test_concept_cache_key_includes_model(tmp_path):
+    model_a = make_chat_model(tmp_path, {"concepts": ["a"]}, model="model-a")
+    model_b = make_chat_model(tmp_path, {"concepts": ["b"]}, model="model-b")
+
+    assert model_a._cache_path("text") != model_b._cache_path("text")
+    assert model_a.extract_concepts("text") == ["a"]
+    assert model_b.extract_concepts("text") == ["b"]
+    assert model_b.chain.calls == 1
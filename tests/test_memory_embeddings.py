@@ -0,0 +1,128 @@
+import base64
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from conversify.core.memory import OllamaEmbeddingModel
+
+
+def encode(vec):
+    return base64.b64encode(np.asarray(vec, dtype=np.float32).tobytes()).decode()
+
+
+class FakeEmbeddings:
+    def __init__(self, fail=False):
+        self.requests = []
+        self.fail = fail
+
+    def create(self, model, input, encoding_format):
+        self.requests.append(list(input))
+        if self.fail:
+            raise RuntimeError("server unavailable")
+        # One vector per text, [len, 1, 2] so every row tells its text apart
+        data = [
+            SimpleNamespace(index=i, embedding=encode([len(text), 1.0, 2.0]))
+            for i, text in enumerate(input)
+        ]
+        return SimpleNamespace(data=data)
+
+
+class FakeAsyncEmbeddings(FakeEmbeddings):
+    async def create(self, model, input, encoding_format):
+        return super().create(model, input, encoding_format)
+
+
+def make_model(fail=False, **config):
+    model = OllamaEmbeddingModel(
+        {"base_url": "http://localhost:1/v1", "model": "embed", **config}
+    )
+    model.client = SimpleNamespace(embeddings=FakeEmbeddings(fail))
+    model.async_client = SimpleNamespace(embeddings=FakeAsyncEmbeddings(fail))
+    return model
+
+
+def test_decode_embedding_base64_and_list():
+    expected = np.array([0.5, -1.0, 3.25], dtype=np.float32)
+
+    decoded = OllamaEmbeddingModel._decode_embedding(encode(expected))
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, expected)
+
+    decoded = OllamaEmbeddingModel._decode_embedding([0.5, -1.0, 3.25])
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, expected)
+
+
+def test_batch_splits_requests_and_zero_fills_empty_text():
+    model = make_model(batch_size=2)
+
+    result = model.get_embeddings_batch(["a", "", "bb", "ccc", "  "])
+
+    assert model.client.embeddings.requests == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(
+        result,
+        [[1, 1, 2], [0, 0, 0], [2, 1, 2], [3, 1, 2], [0, 0, 0]],
+    )
+    assert result.flags.writeable
+
+
+def test_all_empty_batch_is_writable_zeros():
+    model = make_model()
+
+    result = model.get_embeddings_batch(["", "   "])
+
+    assert model.client.embeddings.requests == []
+    assert result.shape == (2, 768)
+    assert not result.any()
+    result[0, 0] = 1.0  # callers may normalize rows in place
+
+
+def test_lru_cache_hits_and_evicts():
+    model = make_model(cache_size=2)
+
+    model.get_embeddings_batch(["a", "bb"])
+    # Case and whitespace differences share an entry
+    model.get_embedding(" A ")
+    assert model.client.embeddings.requests == [["a", "bb"]]
+
+    # "bb" is now least recently used, so "ccc" evicts it
+    model.get_embedding("ccc")
+    model.get_embeddings_batch(["a", "bb"])
+    assert model.client.embeddings.requests == [["a", "bb"], ["ccc"], ["bb"]]
+
+
+def test_failed_request_leaves_zero_rows_or_raises():
+    model = make_model(fail=True)
+
+    result = model.get_embeddings_batch(["a"])
+    np.testing.assert_array_equal(result, np.zeros((1, 768), dtype=np.float32))
+
+    with pytest.raises(RuntimeError):
+        model.get_embeddings_batch(["a"], raise_on_error=True)
+
+
+@pytest.mark.asyncio
+async def test_async_batch_matches_sync():
+    model = make_model(batch_size=2)
+
+    result = await model.aget_embeddings_batch(["a", "", "bb", "ccc"])
+
+    assert model.async_client.embeddings.requests == [["a", "bb"], ["ccc"]]
+    np.testing.assert_array_equal(
+        result, model.get_embeddings_batch(["a", "", "bb", "ccc"])
+    )
+    # The sync call above was served from the cache the async one filled
+    assert model.client.embeddings.requests == []
+    np.testing.assert_array_equal(await model.aget_embedding("bb"), [2, 1, 2])
+
+
+@pytest.mark.asyncio
+async def test_async_failed_request_raises_when_asked():
+    model = make_model(fail=True)
+
+    result = await model.aget_embeddings_batch(["a", "bb"])
+    assert not result.any()
+
+    with pytest.raises(RuntimeError):
+        await model.aget_embeddings_batch(["a"], raise_on_error=True)
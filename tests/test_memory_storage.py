@@ -0,0 +1,130 @@
+import json
+from types import SimpleNamespace
+
+import numpy as np
+
+from conversify.core.memory import JSONLStorage
+
+
+def make_store():
+    return SimpleNamespace(
+        short_term_memory=[],
+        long_term_memory=[],
+        embeddings=[],
+        timestamps=[],
+        access_counts=[],
+        concepts_list=[],
+    )
+
+
+def add_interaction(store, interaction_id):
+    # Mirrors the parallel lists Memoripy's MemoryStore keeps per interaction
+    store.short_term_memory.append(
+        {
+            "id": interaction_id,
+            "prompt": f"prompt {interaction_id}",
+            "output": f"output {interaction_id}",
+            "decay_factor": 1.0,
+        }
+    )
+    store.embeddings.append(np.full((1, 4), len(store.embeddings), dtype=np.float32))
+    store.timestamps.append(float(len(store.timestamps)))
+    store.access_counts.append(1)
+    store.concepts_list.append({f"concept {interaction_id}"})
+
+
+def test_save_load_roundtrip(tmp_path):
+    path = tmp_path / "user.jsonl"
+    store = make_store()
+    add_interaction(store, "a")
+    add_interaction(store, "b")
+    store.long_term_memory.append({"id": "a", "prompt": "prompt a"})
+
+    storage = JSONLStorage(str(path))
+    assert storage.load_history() == ([], [])
+    storage.save_memory_to_history(store)
+
+    short_term, long_term = JSONLStorage(str(path)).load_history()
+    assert [r["id"] for r in short_term] == ["a", "b"]
+    assert short_term[1]["prompt"] == "prompt b"
+    assert short_term[1]["embedding"] == [1.0, 1.0, 1.0, 1.0]
+    assert short_term[1]["concepts"] == ["concept b"]
+    assert long_term == [{"id": "a", "prompt": "prompt a"}]
+
+
+def test_reload_after_incremental_appends(tmp_path):
+    path = tmp_path / "user.jsonl"
+    store = make_store()
+    storage = JSONLStorage(str(path))
+    # Below the compaction threshold each save only appends its new records
+    add_interaction(store, "0")
+    storage.save_memory_to_history(store)
+    add_interaction(store, "1")
+    storage.save_memory_to_history(store)
+    assert path.read_bytes().count(b"\n") == 2
+
+    # A reloaded storage picks up where the log left off
+    storage = JSONLStorage(str(path))
+    storage.load_history()
+    add_interaction(store, "2")
+    storage.save_memory_to_history(store)
+
+    short_term, _ = JSONLStorage(str(path)).load_history()
+    assert [r["id"] for r in short_term] == ["0", "1", "2"]
+
+
+def test_compaction_keeps_every_interaction(tmp_path):
+    path = tmp_path / "user.jsonl"
+    store = make_store()
+    storage = JSONLStorage(str(path))
+    # The log grows past twice its compacted size, so saves compact along the way
+    for i in range(10):
+        add_interaction(store, str(i))
+        storage.save_memory_to_history(store)
+        short_term, _ = JSONLStorage(str(path)).load_history()
+        assert [r["id"] for r in short_term] == [str(j) for j in range(i + 1)]
+    store.access_counts[0] = 7
+    storage.compact(store)
+
+    # Compaction rewrites one record per interaction, with the updated state
+    assert path.read_bytes().count(b"\n") == 10
+    short_term, _ = JSONLStorage(str(path)).load_history()
+    assert [r["id"] for r in short_term] == [str(i) for i in range(10)]
+    assert short_term[0]["access_count"] == 7
+
+
+def test_migrates_legacy_json(tmp_path):
+    legacy_path = tmp_path / "user.json"
+    interaction = {
+        "id": "a",
+        "prompt": "prompt a",
+        "output": "output a",
+        "embedding": [1.0, 2.0],
+        "timestamp": 1.0,
+        "access_count": 3,
+        "concepts": ["concept a"],
+        "decay_factor": 1.0,
+    }
+    legacy_path.write_text(
+        json.dumps({"short_term_memory": [interaction], "long_term_memory": []})
+    )
+    path = tmp_path / "user.jsonl"
+
+    storage = JSONLStorage(str(path), legacy_json_path=str(legacy_path))
+    short_term, long_term = storage.load_history()
+    assert short_term == [interaction]
+    assert long_term == []
+    assert not path.exists()
+
+    # The first save writes the migrated history into the new log
+    store = make_store()
+    store.short_term_memory.append(
+        {"id": "a", "prompt": "prompt a", "output": "output a"}
+    )
+    store.embeddings.append(np.array([[1.0, 2.0]], dtype=np.float32))
+    store.timestamps.append(1.0)
+    store.access_counts.append(3)
+    store.concepts_list.append({"concept a"})
+    storage.save_memory_to_history(store)
+
+    assert JSONLStorage(str(path)).load_history() == ([interaction], [])
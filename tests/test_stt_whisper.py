@@ -1,5 +1,5 @@
-import io
-import wave
+import contextlib
+import sys
 from types import SimpleNamespace
 
 import numpy as np
@@ -8,78 +8,74 @@ import pytest
 import conversify.models.stt as mod
 from conversify.models.stt import WhisperSTT
 
+# 0.2 s of silent 16-bit mono PCM at 16 kHz; the fake model never inspects it
+_PCM_BYTES = b"\x00\x00" * 3200
+
+
+class FakeSegment:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeWhisperModel:
+    def __init__(
+        self,
+        model_size_or_path,
+        device,
+        compute_type,
+        download_root,
+        cpu_threads,
+        num_workers,
+        local_files_only=False,
+    ):
+        # store for inspection if needed
+        self.model_size_or_path = model_size_or_path
+        self.device = device
+        self.compute_type = compute_type
+        self.download_root = download_root
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+
+    def transcribe(self, audio, **kwargs):
+        # Return a single segment "hello world"
+        return [FakeSegment("hello world")], SimpleNamespace(
+            duration=0.2, language=kwargs.get("language")
+        )
+
+
+CONFIG = {
+    "stt": {
+        "whisper": {
+            "language": "en",
+            "model": "small",
+            "backend": "faster-whisper",
+            "device": None,
+            "compute_type": None,
+            "model_cache_directory": None,
+            "warmup_audio": None,
+        }
+    }
+}
 
-@pytest.mark.asyncio
-async def test_whisperstt_transcribe_returns_text_on_mac(monkeypatch):
-    monkeypatch.setattr(mod.platform, "system", lambda: "Darwin")
-    monkeypatch.setattr(mod.platform, "machine", lambda: "arm64")
-
-    class FakeSegment:
-        def __init__(self, text: str):
-            self.text = text
-
-    class FakeWhisperModel:
-        def __init__(
-            self,
-            model_size_or_path,
-            device,
-            compute_type,
-            download_root,
-            cpu_threads,
-            num_workers,
-        ):
-            # store for inspection if needed
-            self.model_size_or_path = model_size_or_path
-            self.device = device
-            self.compute_type = compute_type
-            self.download_root = download_root
-            self.cpu_threads = cpu_threads
-            self.num_workers = num_workers
-
-        def transcribe(self, audio, **kwargs):
-            # Return a single segment "hello world"
-            return [FakeSegment("hello world")], SimpleNamespace(
-                duration=0.2, language=kwargs.get("language")
-            )
 
+def make_stt(monkeypatch):
     monkeypatch.setattr(mod, "WhisperModel", FakeWhisperModel)
+    return WhisperSTT(CONFIG)
 
-    def make_wav_bytes(sr=16000, seconds=0.2):
-        t = np.linspace(0, seconds, int(sr * seconds), endpoint=False)
-        sig = (0.1 * np.sin(2 * np.pi * 440 * t)).astype(np.float32)
-        pcm = np.clip(sig * 32767, -32768, 32767).astype(np.int16)
-
-        bio = io.BytesIO()
-        with wave.open(bio, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)  # 16-bit PCM
-            wf.setframerate(sr)
-            wf.writeframes(pcm.tobytes())
-        return bio.getvalue()
 
-    class FakeCombinedFrames:
-        def to_wav_bytes(self):
-            return make_wav_bytes()
+@pytest.mark.asyncio
+async def test_whisperstt_transcribe_returns_text_on_mac(monkeypatch):
+    monkeypatch.setattr(mod.platform, "system", lambda: "Darwin")
+    monkeypatch.setattr(mod.platform, "machine", lambda: "arm64")
 
+    combined_frames = SimpleNamespace(
+        data=_PCM_BYTES, num_channels=1, sample_rate=16000
+    )
     monkeypatch.setattr(
-        mod.rtc, "combine_audio_frames", lambda _buffer: FakeCombinedFrames()
+        mod.rtc, "combine_audio_frames", lambda _buffer: combined_frames
     )
 
-    config = {
-        "stt": {
-            "whisper": {
-                "language": "en",
-                "model": "small",
-                "backend": "faster-whisper",
-                "device": None,
-                "compute_type": None,
-                "model_cache_directory": None,
-                "warmup_audio": None,
-            }
-        }
-    }
-
-    stt_inst = WhisperSTT(config)
+    stt_inst = make_stt(monkeypatch)
 
     # Sanity check: with our patched platform, it should prefer "metal"
     assert stt_inst._default_device(None) == "metal"
@@ -95,3 +91,106 @@ async def test_whisperstt_transcribe_returns_text_on_mac(monkeypatch):
     assert event.type == mod.stt.SpeechEventType.FINAL_TRANSCRIPT
     assert event.alternatives[0].text == "hello world"
     assert event.alternatives[0].language == "en"
+
+
+def test_failed_reload_is_logged_and_keeps_model(monkeypatch, caplog):
+    stt_inst = make_stt(monkeypatch)
+    model = stt_inst._ready.result()
+
+    class BrokenWhisperModel(FakeWhisperModel):
+        def __init__(self, *args, **kwargs):
+            raise RuntimeError("no such model")
+
+    monkeypatch.setattr(mod, "WhisperModel", BrokenWhisperModel)
+    with caplog.at_level("ERROR", logger=mod.logger.name):
+        stt_inst.update_options(model="missing")
+        with pytest.raises(RuntimeError):
+            stt_inst._reload.result()
+        # Done-callbacks may still be running when result() returns
+        mod._MODEL_LOADER.submit(lambda: None).result()
+
+    assert stt_inst._model is model
+    assert "reload failed, keeping the current model: no such model" in caplog.text
+
+
+def test_resample_48k_stereo_reuses_resampler(monkeypatch):
+    stt_inst = make_stt(monkeypatch)
+
+    # 0.1 s of 48 kHz stereo, the usual WebRTC capture format
+    frame = mod.rtc.AudioFrame.create(48000, 2, 4800)
+    first = stt_inst._resample(frame)
+    assert first.sample_rate == mod.WHISPER_SAMPLE_RATE
+    assert first.num_channels == 2
+    assert first.samples_per_channel == 1600
+
+    resampler = stt_inst._resamplers[(48000, 2)]
+    second = stt_inst._resample(frame)
+    assert second.samples_per_channel == 1600
+    assert list(stt_inst._resamplers) == [(48000, 2)]
+    assert stt_inst._resamplers[(48000, 2)] is resampler
+
+    # A different layout gets its own resampler
+    stt_inst._resample(mod.rtc.AudioFrame.create(48000, 1, 4800))
+    assert set(stt_inst._resamplers) == {(48000, 2), (48000, 1)}
+
+
+def test_pcm_to_mono_f32_downmixes_stereo():
+    # Interleaved L/R pairs: full-scale opposites cancel, equal channels keep
+    pcm = np.array([32767, -32768, 16384, 16384, -16384, 0], dtype=np.int16)
+    expected = np.array([-0.5, 16384, -8192], dtype=np.float32) / 32768.0
+
+    out = np.empty(3, dtype=np.float32)
+    mono = mod._pcm_to_mono_f32(pcm, 2, out=out)
+    assert mono is out
+    np.testing.assert_allclose(mono, expected, rtol=0, atol=1e-7)
+
+    mono = mod._pcm_to_mono_f32(pcm, 1)
+    assert mono.dtype == np.float32
+    assert len(mono) == 6
+    assert mono[1] == -1.0
+
+
+def test_transformers_windows_overlap_and_batch(monkeypatch):
+    monkeypatch.setitem(
+        sys.modules, "torch", SimpleNamespace(inference_mode=contextlib.nullcontext)
+    )
+    rate = mod.WHISPER_SAMPLE_RATE
+    # Each window's transcript repeats the words spoken in the shared 5 s
+    transcripts = {
+        0: "The quick brown fox",
+        25 * rate: "brown fox jumps over",
+        50 * rate: "over the lazy dog.",
+    }
+    batches = []
+
+    class FakeFeatures:
+        def __init__(self, chunks):
+            self.chunks = chunks
+
+        def to(self, device, dtype=None):
+            return self.chunks
+
+    def feature_extractor(chunks, sampling_rate, return_tensors):
+        batches.append([(int(c[0]), len(c)) for c in chunks])
+        return SimpleNamespace(input_features=FakeFeatures(chunks))
+
+    processor = SimpleNamespace(
+        feature_extractor=feature_extractor,
+        batch_decode=lambda chunks, skip_special_tokens: [
+            transcripts[int(c[0])] for c in chunks
+        ],
+    )
+    model = SimpleNamespace(generate=lambda features, **kwargs: features)
+    whisper = mod._TransformersWhisper(model, processor, "cpu", None, batch_size=2)
+
+    # Sample values are their own index, so each window reveals where it starts
+    audio = np.arange(70 * rate, dtype=np.float32)
+    text = whisper.transcribe(audio, language="en")
+
+    assert batches == [
+        [(0, 30 * rate), (25 * rate, 30 * rate)],
+        [(50 * rate, 20 * rate)],
+    ]
+    assert text == "The quick brown fox jumps over the lazy dog."
+    assert whisper.transcribe(audio[: 30 * rate]) == "The quick brown fox"
+    assert whisper.transcribe(audio[:0]) == ""